@@ -0,0 +1,268 @@
+from collections import OrderedDict
+import hashlib
+import itertools
+import json
+import mmap
+import os
+import weakref
+import pygame as pyg
+
+
+# where prebuild.py writes preprocessed textures
+CACHE_DIR = ".asset_cache"
+PACK_FILE = "pack.bin"
+# bump when the build output changes, so every entry is rebuilt
+BUILD_VERSION = 1
+
+# every texture the game draws; prebuild.py builds these, Session warms them
+BASES = [f"Assets/base_{i}.png" for i in range(1, 7)]
+MASKS = [f"Assets/mask_{i}.png" for i in range(1, 10)]
+TEXTURES = BASES + MASKS + ["Assets/baldo_01.png", "Assets/jam.png", "Assets/marmelade.png"]
+
+
+# shared use counter, so entries of different caches can be compared by age
+_clock = itertools.count()
+
+
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def sound_bytes(sound):
+    init = pyg.mixer.get_init()
+    if not init:
+        return 0
+    freq, fmt, channels = init
+    return int(sound.get_length() * freq * channels * (abs(fmt) // 8))
+
+
+def font_file_bytes(name=None):
+    """Size of a font file (None: pygame's default font), an estimate for
+    the fonts loaded from it; pygame keeps no size for a Font."""
+    path = name or os.path.join(os.path.dirname(pyg.__file__), pyg.font.get_default_font())
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+def scale_str(scale):
+    return f"{float(scale):g}"
+
+
+def sprite_key(path, scale):
+    return f"{path}@{scale_str(scale)}"
+
+
+def composite_key(base, mask, scale):
+    return f"{base}+{mask}@{scale_str(scale)}"
+
+
+# path -> (mtime, size, digest); a file edited since is hashed again
+_file_digests = {}
+
+
+def file_digest(path):
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    memo = _file_digests.get(path)
+    if memo is None or memo[0] != stamp:
+        with open(path, "rb") as f:
+            memo = _file_digests[path] = (stamp, hashlib.sha1(f.read()).hexdigest())
+    return memo[1]
+
+
+def content_hash(sources, scale):
+    """Cache file name for `sources` (composed in order) at `scale`."""
+    h = hashlib.sha1(f"v{BUILD_VERSION}@{scale_str(scale)}".encode())
+    for path in sources:
+        h.update(file_digest(path).encode())
+    return h.hexdigest()
+
+
+class AssetStore:
+    """Read side of the prebuilt texture cache written by prebuild.py.
+
+    Each entry is raw BGRA pixels (the display's own 32-bit layout, so no
+    conversion is needed) plus a visible/opaque byte mask per pixel, at an
+    offset in one pack file that is memory-mapped once. Entries whose
+    sources changed since the build are ignored, and callers fall back to
+    loading the PNG.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.index = {}
+        self._checked = {}
+        self._view = None
+
+        index_path = os.path.join(cache_dir, "index.json")
+        pack_path = os.path.join(cache_dir, PACK_FILE)
+        if not (os.path.exists(index_path) and os.path.exists(pack_path)):
+            return
+        with open(index_path) as f:
+            index = json.load(f)
+        if os.path.getsize(pack_path) != index.get("pack_size"):
+            return  # half-written build, ignore it
+
+        with open(pack_path, "rb") as f:
+            # private copy-on-write mapping, Surfaces share its pages
+            self._view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+        self.index = index["entries"]
+
+    def _entry(self, key):
+        ok = self._checked.get(key)
+        if ok is None:
+            entry = self.index.get(key)
+            ok = entry is not None and all(
+                os.path.exists(path) for path in entry["sources"]
+            ) and content_hash(entry["sources"], entry["scale"]) == entry["hash"]
+            self._checked[key] = ok
+        return self.index[key] if ok else None
+
+    def surface(self, key):
+        entry = self._entry(key)
+        if entry is None:
+            return None
+        w, h = entry["size"]
+        start = entry["offset"]
+        return pyg.image.frombuffer(self._view[start:start + w * h * 4], (w, h), "BGRA")
+
+    def masks(self, key):
+        """(visible, opaque) pygame masks, or None."""
+        entry = self._entry(key)
+        if entry is None:
+            return None
+        w, h = entry["size"]
+        result = []
+        for plane in range(2):
+            start = entry["mask_offset"] + plane * w * h
+            surf = pyg.image.frombuffer(self._view[start:start + w * h], (w, h), "P")
+            surf.set_colorkey(0)
+            result.append(pyg.mask.from_surface(surf))
+        return tuple(result)
+
+    def features(self, key):
+        entry = self._entry(key)
+        return entry["features"] if entry else None
+
+
+class AssetCache:
+    """Least-recently-used cache of loaded assets with byte accounting.
+
+    Subclasses load assets through `_lookup` / `_store`. When `budget_bytes`
+    is set the cache evicts its own coldest entries to stay under it; the
+    MemoryMonitor can also evict across caches. Only entries nothing else
+    holds are evicted: dropping one a live entity or widget still uses
+    would free nothing, and the next `get` would load a second copy. To
+    find out, `evict` drops the cache's reference and checks through a
+    weakref whether the asset was freed; if not, the reference is put back.
+    """
+
+    name = "assets"
+
+    def __init__(self, budget_bytes=None):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()  # key -> [asset, nbytes, last_used]
+        self.bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        entry[2] = next(_clock)
+        self.hits += 1
+        return entry[0]
+
+    def _store(self, key, asset, nbytes):
+        self._entries[key] = [asset, nbytes, next(_clock)]
+        self.bytes += nbytes
+        if self.budget_bytes is not None:
+            # the entry just added is held by the caller, so it stays
+            for old, _ in self.use_stamps():
+                if self.bytes <= self.budget_bytes:
+                    break
+                self.evict(old)
+        return asset
+
+    def use_stamps(self):
+        """(key, last use stamp) of every entry, least recently used first."""
+        return [(key, entry[2]) for key, entry in self._entries.items()]
+
+    def evict(self, key):
+        """Drop `key` if nothing outside the cache holds its asset. Returns
+        True when it was freed."""
+        entry = self._entries[key]
+        ref = weakref.ref(entry[0])
+        entry[0] = None
+        asset = ref()
+        if asset is not None:
+            entry[0] = asset  # still in use, keep it
+            return False
+        self._evict(key)
+        return True
+
+    def _evict(self, key):
+        _, nbytes, _ = self._entries.pop(key)
+        self.bytes -= nbytes
+        self.evictions += 1
+
+    def asset_bytes(self):
+        return {key: entry[1] for key, entry in self._entries.items()}
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+
+class SoundCache(AssetCache):
+    name = "sounds"
+
+    def get(self, path):
+        sound = self._lookup(path)
+        if sound is None:
+            sound = pyg.mixer.Sound(path)
+            self._store(path, sound, sound_bytes(sound))
+        return sound
+
+
+class FontCache(AssetCache):
+    """Fonts per (file, size). The sizes of one file share its byte
+    estimate (see font_file_bytes), carried by one of its entries and
+    handed on to another when that one is evicted."""
+
+    name = "fonts"
+
+    def get(self, size, name=None):
+        key = (name, size)
+        font = self._lookup(key)
+        if font is None:
+            pyg.font.init()
+            font = pyg.font.Font(name, size)
+            shared = any(other[0] == name for other in self._entries)
+            self._store(key, font, 0 if shared else font_file_bytes(name))
+        return font
+
+    def file_of(self, font):
+        """The file `font` was loaded from, None for the default font or a
+        font this cache did not load."""
+        for key, entry in self._entries.items():
+            if entry[0] is font:
+                return key[0]
+        return None
+
+    def _evict(self, key):
+        nbytes = self._entries[key][1]
+        super()._evict(key)
+        for other, entry in self._entries.items():
+            if nbytes and other[0] == key[0]:
+                entry[1] = nbytes
+                self.bytes += nbytes
+                break
+
+
+sound_cache = SoundCache()
+font_cache = FontCache()
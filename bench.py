@@ -0,0 +1,268 @@
+"""Headless benchmarks. Run e.g. `python bench.py render`."""
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import scenes
+from assets import AssetStore, font_cache, sound_cache
+from memory import MemoryMonitor
+import prebuild
+from render import SpriteCache, sprite_cache
+from session import Session
+
+
+def make_manager(scene_cls, width=960, height=540, **kwargs):
+    pygame.init()
+    screen = pygame.display.set_mode((width, height))
+    manager = scenes.SceneManager(scene_cls, screen, **kwargs)
+    build_level(manager)
+    return manager
+
+
+def build_level(manager):
+    """Finish building a BetterScene level in one go."""
+    scene = manager.current_scene
+    if getattr(scene, "builder", None) is not None:
+        scene.advance_build()
+
+
+def time_draws(scene, surface, frames):
+    """Mean and worst draw time in milliseconds over `frames` frames."""
+    scene.draw(surface)  # warm up caches and the world surface
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        scene.draw(surface)
+        times.append((time.perf_counter() - start) * 1000)
+    return sum(times) / len(times), max(times)
+
+
+def bench_render(frames, seed):
+    manager = make_manager(scenes.BetterScene, session=Session(seed))
+    scene = manager.current_scene
+    print(f"BetterScene, {len(scene.entities)} entities, {frames} frames")
+
+    modes = [(1.0, False), (0.75, False), (0.75, True), (0.5, False), (0.5, True)]
+    for cached_layer in (False, True):
+        for render_scale, smooth in modes:
+            manager.render.render_scale = render_scale
+            manager.render.smooth = smooth
+            manager.render.cached_layer = cached_layer
+            mean, worst = time_draws(scene, manager.screen, frames)
+            name = "smooth" if smooth else "nearest"
+            layer = "cached layer" if cached_layer else ""
+            print(
+                f"  scale {render_scale:<4} {name:<8} {layer:<12}"
+                f" mean {mean:6.2f} ms  worst {worst:6.2f} ms"
+            )
+
+
+def bench_occlusion(frames, seed):
+    manager = make_manager(scenes.MenuScene)
+    for level in range(5):
+        manager.session.rng.seed(seed + level)
+        manager.change_scene(scenes.BetterScene)
+        build_level(manager)
+        scene = manager.current_scene
+        culler = scene.culler
+
+        culled_mean, _ = time_draws(scene, manager.screen, frames)
+        draw_list = scene.draw_list
+        scene.draw_list = scene.entities
+        full_mean, _ = time_draws(scene, manager.screen, frames)
+        scene.draw_list = draw_list
+
+        print(
+            f"level {level}: {len(scene.entities):4} entities,"
+            f" culled {culler.culled_count:3} entities / {culler.culled_blits:3} blits,"
+            f" draw {full_mean:5.2f} -> {culled_mean:5.2f} ms"
+        )
+
+
+def bench_memory(frames, seed, cycles=20):
+    """Play-again cycles (BetterScene -> WinScene) with tracemalloc on."""
+    monitor = MemoryMonitor(trace=True)
+    manager = make_manager(scenes.MenuScene, memory=monitor)
+    for _ in range(cycles):
+        # same level every cycle, so any growth is retained state
+        manager.session.rng.seed(seed)
+        manager.change_scene(scenes.BetterScene)
+        build_level(manager)
+        manager.current_scene.draw(manager.screen)
+        manager.change_scene(scenes.WinScene)
+
+    rounds = [r for r in monitor.history if r["scene"] == "BetterScene"]
+    growth = [r["heap_growth"] for r in rounds[1:]]
+    print(f"{cycles} play-again cycles, BetterScene heap growth per cycle (bytes):")
+    print("  ", growth)
+    print("largest cached assets:")
+    for cache, key, nbytes in monitor.asset_report()[:5]:
+        print(f"   {cache:<7} {str(key):<40} {nbytes / 1024:7.1f} KB")
+
+
+def bench_rounds(frames, seed, rounds=100):
+    """Consecutive BetterScene rounds, sharing one Session or not.
+
+    Levels have 120-1800 decoys, so setup time is shown per entity. Timing
+    and heap are measured in separate passes, tracemalloc slows setup down.
+    """
+    mean = lambda xs: sum(xs) / len(xs)
+
+    for warm in (True, False):
+        for trace in (False, True):
+            if trace:
+                tracemalloc.start()
+            manager = make_manager(
+                scenes.MenuScene,
+                session=Session(seed),
+                # the report history is bounded but would fill over the run
+                memory=MemoryMonitor(history=1),
+            )
+            per_entity, heap = [], []
+            for _ in range(rounds):
+                if not warm:
+                    # what every round paid before: no pool, no warm caches
+                    manager.session = Session(manager.session.rng.random(), pool=False)
+                    for cache in (sprite_cache, sound_cache, font_cache):
+                        cache.clear()
+                start = time.perf_counter()
+                manager.change_scene(scenes.BetterScene)
+                build_level(manager)
+                elapsed = time.perf_counter() - start
+                per_entity.append(elapsed * 1e6 / len(manager.current_scene.entities))
+                manager.current_scene.draw(manager.screen)
+                if trace:
+                    gc.collect()
+                    heap.append(tracemalloc.get_traced_memory()[0] / 1024)
+
+            if not trace:
+                print(f"{rounds} rounds, {'shared Session' if warm else 'cold every round'}:")
+                half = rounds // 2
+                print(
+                    f"  setup us/entity: round 1 {per_entity[0]:.1f},"
+                    f" rounds 2-{half} mean {mean(per_entity[1:half]):.1f},"
+                    f" rounds {half + 1}-{rounds} mean {mean(per_entity[half:]):.1f}"
+                )
+            else:
+                tracemalloc.stop()
+                # heap after a round follows that level's size, compare halves
+                half = rounds // 2
+                print(
+                    f"  heap KB: round 1 {heap[0]:.0f},"
+                    f" rounds 2-{half} mean {mean(heap[1:half]):.0f} max {max(heap[1:half]):.0f},"
+                    f" rounds {half + 1}-{rounds} mean {mean(heap[half:]):.0f} max {max(heap[half:]):.0f}"
+                )
+
+
+def bench_assets(frames, seed, repeats=20):
+    """Load every prebuilt output through a fresh SpriteCache, from the
+    .asset_cache store (memory-mapped) and from the PNGs."""
+    make_manager(scenes.MenuScene)
+    report = prebuild.build()
+    print(
+        f"prebuild: {report['outputs']} outputs, {report['hits']} hits,"
+        f" {report['built']} built in {report['seconds'] * 1000:.0f} ms"
+    )
+
+    outputs = list(prebuild.jobs())
+    for name, store in (("store", AssetStore()), ("png", None)):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            cache = SpriteCache(store=store)
+            for _, sources, scale in outputs:
+                if len(sources) > 1:
+                    cache.get_composite(sources[0], sources[1], scale)
+                else:
+                    cache.get(sources[0], scale)
+        elapsed = (time.perf_counter() - start) * 1000 / repeats
+        print(f"  {len(outputs)} textures from {name:<5}: {elapsed:6.2f} ms")
+
+
+def bench_build(frames, seed, levels=5):
+    """Time-sliced level construction, frame by frame as the game runs it:
+    update + draw per frame until the level is built."""
+    manager = make_manager(scenes.MenuScene, session=Session(seed))
+    for _ in range(levels):
+        start = time.perf_counter()
+        manager.change_scene(scenes.BetterScene)
+        change_ms = (time.perf_counter() - start) * 1000
+        scene = manager.current_scene
+        # as seen from outside, with the build log and memory report
+        frame_times = []
+        while scene.builder is not None:
+            frame_start = time.perf_counter()
+            scene.run_frame(manager.screen, 1 / 60)
+            frame_times.append((time.perf_counter() - frame_start) * 1000)
+
+        print(
+            f"  {len(scene.entities):4} entities: built in"
+            f" {manager.session.setup_times[-1] * 1000:5.1f} ms over"
+            f" {scene.build_frames:2} frames, worst slice"
+            f" {scene.build_worst_slice_ms:4.1f} ms, worst frame"
+            f" {manager.session.worst_frames[-1]:4.1f} ms"
+            f" ({max(frame_times):4.1f} ms with the report),"
+            f" scene change {change_ms:4.1f} ms, round clock {scene.time_thingy:.1f} s"
+        )
+
+        # the whole level in one call, as before
+        manager.change_scene(scenes.BetterScene)
+        start = time.perf_counter()
+        build_level(manager)
+        print(f"       in one call: {(time.perf_counter() - start) * 1000:5.1f} ms")
+
+
+def bench_events(frames, seed, motions=50):
+    """A flood of mouse motion, window and key events per frame
+    through the MenuScene pipeline."""
+    manager = make_manager(scenes.MenuScene)
+    events = manager.events
+    pygame.event.clear()
+
+    blocked = 0
+    times = []
+    for i in range(frames):
+        for j in range(motions):
+            pygame.event.post(pygame.event.Event(
+                pygame.MOUSEMOTION, pos=(j, i), rel=(1, 0), buttons=(0, 0, 0)
+            ))
+        # no MenuScene handler: never queued
+        if not pygame.event.post(pygame.event.Event(pygame.WINDOWMOVED, x=0, y=0)):
+            blocked += 1
+        # always allowed, goes to the menu's key handler
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0))
+
+        start = time.perf_counter()
+        for event in events.poll():
+            events.dispatch(manager.current_scene, event)
+        times.append((time.perf_counter() - start) * 1000)
+
+    print(f"{frames} frames, {motions} motions + 1 window + 1 key event each")
+    print(f"  {events.format()}")
+    print(f"  blocked at the queue: {blocked}")
+    print(f"  poll + dispatch mean {sum(times) / len(times):.3f} ms, worst {max(times):.3f} ms")
+
+
+BENCHMARKS = {
+    "render": bench_render,
+    "occlusion": bench_occlusion,
+    "memory": bench_memory,
+    "rounds": bench_rounds,
+    "assets": bench_assets,
+    "build": bench_build,
+    "events": bench_events,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    BENCHMARKS[args.benchmark](args.frames, args.seed)
@@ -1,6 +1,7 @@
 from enum import Enum
 import random
 import pygame as pyg
+from render import sprite_cache
 
 
 class ENTITY(Enum):
@@ -15,33 +16,68 @@ class ENTITY(Enum):
 # --------------------------------------------------
 
 class Entity:
-    def __init__(self, x, y, base_texture, mask_texture=None, scale=2):
-        self.x = x
-        self.y = y
+    def __init__(self, x, y, base_texture, mask_texture=None, scale=2, sprites=sprite_cache):
         self.scale = scale
+        # where the textures come from, normally the Session's cache
+        self.sprites = sprites
+        self.place(x, y, base_texture, mask_texture)
 
-        # Load images ONCE
-        self.base_image = pyg.image.load(base_texture).convert_alpha()
-        self.mask_image = (
-            pyg.image.load(mask_texture).convert_alpha()
-            if mask_texture else None
-        )
-
-        # Pre-scale images
-        self.scaled_base = pyg.transform.scale_by(self.base_image, self.scale)
-        self.scaled_mask = (
-            pyg.transform.scale_by(self.mask_image, self.scale)
-            if self.mask_image else None
-        )
+    def place(self, x, y, base_texture, mask_texture=None):
+        """(Re)position the entity with the given textures. Lets a Session
+        reuse entities from one round to the next."""
+        self.x = x
+        self.y = y
+        self.base_texture = base_texture
+        self.mask_texture = mask_texture
+
+        # Pre-scale images (loaded ONCE and shared through the sprite cache,
+        # the unscaled originals are not kept per entity). A mask comes
+        # pre-composed over the base, so it costs no extra blit.
+        if mask_texture:
+            self.scaled_base = self.sprites.get_composite(
+                base_texture, mask_texture, self.scale
+            )
+        else:
+            self.scaled_base = self.sprites.get(base_texture, self.scale)
+        self.scaled_mask = None
 
         # Rect exists immediately (important!)
         self.rect = self.scaled_base.get_rect(topleft=(self.x, self.y))
 
+        # Set by OcclusionCuller when later entities hide this one entirely
+        self.culled = False
+
+        # What draw_scaled blits, see set_render_scale
+        self.render_base = self.scaled_base
+        self.render_mask = self.scaled_mask
+        self.render_pos = self.rect.topleft
+
+    def set_render_scale(self, render_scale, smooth=False):
+        """Prepare sprites for drawing into a surface `render_scale` times
+        the size of the screen. The rect stays in screen coordinates."""
+        scale = self.scale * render_scale
+        if self.mask_texture:
+            self.render_base = self.sprites.get_composite(
+                self.base_texture, self.mask_texture, scale, smooth
+            )
+        else:
+            self.render_base = self.sprites.get(self.base_texture, scale, smooth)
+        self.render_mask = None
+        self.render_pos = (
+            int(self.rect.x * render_scale),
+            int(self.rect.y * render_scale),
+        )
+
     def draw(self, surface):
         surface.blit(self.scaled_base, self.rect.topleft)
         if self.scaled_mask:
             surface.blit(self.scaled_mask, self.rect.topleft)
 
+    def draw_scaled(self, surface):
+        surface.blit(self.render_base, self.render_pos)
+        if self.render_mask:
+            surface.blit(self.render_mask, self.render_pos)
+
         # Debug hitbox (optional)
         # pyg.draw.rect(surface, (255, 0, 0), self.rect, 2)
 
@@ -56,8 +92,8 @@ class Entity:
 # --------------------------------------------------
 
 class Baldo(Entity):
-    def __init__(self, x, y, base_texture="Assets/baldo_01.png"):
-        super().__init__(x, y, base_texture)
+    def __init__(self, x, y, base_texture="Assets/baldo_01.png", sprites=sprite_cache):
+        super().__init__(x, y, base_texture, sprites=sprites)
 
     def on_click(self, event):
         if super().on_click(event):
@@ -70,14 +106,19 @@ class Baldo(Entity):
 # --------------------------------------------------
 
 class Waldo(Entity):
-    def __init__(self, x, y, scale=2):
-        base, mask = self._random_textures()
-        super().__init__(x, y, base, mask, scale)
+    def __init__(self, x, y, scale=2, rng=random, sprites=sprite_cache):
+        base, mask = self._random_textures(rng)
+        super().__init__(x, y, base, mask, scale, sprites)
+
+    def reroll(self, x, y, rng=random):
+        """Move to (x, y) with new random textures."""
+        base, mask = self._random_textures(rng)
+        self.place(x, y, base, mask)
 
-    def _random_textures(self):
+    def _random_textures(self, rng=random):
         path = "Assets/"
-        base = f"{path}base_{random.randint(1, 6)}.png"
-        mask = f"{path}mask_{random.randint(1, 9)}.png"
+        base = f"{path}base_{rng.randint(1, 6)}.png"
+        mask = f"{path}mask_{rng.randint(1, 9)}.png"
         return base, mask
 
     def on_click(self, event):
@@ -91,7 +132,7 @@ class Waldo(Entity):
 # --------------------------------------------------
 
 class Jar(Entity):
-    def __init__(self, x, y, jar_type, scale=2):
+    def __init__(self, x, y, jar_type, scale=2, sprites=sprite_cache):
         self.jar_type = jar_type
 
         texture = (
@@ -100,7 +141,7 @@ class Jar(Entity):
             else "Assets/marmelade.png"
         )
 
-        super().__init__(x, y, texture, scale=scale)
+        super().__init__(x, y, texture, scale=scale, sprites=sprites)
 
     def on_click(self, event):
         if super().on_click(event):
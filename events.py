@@ -0,0 +1,97 @@
+import pygame
+
+
+# Events the main loop itself needs, whatever the active scene wants.
+ALWAYS_ALLOWED = (pygame.QUIT, pygame.KEYDOWN)
+
+
+class EventPipeline:
+    """Pulls pygame events once per frame and routes them to the active scene.
+
+    Each scene declares the event types it consumes through its `handlers`
+    table (event type -> callable). On scene change, `configure` blocks every
+    other type at the SDL queue so unused floods (window, audio, motion...)
+    never reach Python. Motion events left in the queue are coalesced into one
+    per frame, in the place of the last of them. Events are counted per frame and in total as processed (a
+    handler ran, or the main loop `consume`d them) or dropped (coalesced, or
+    no handler).
+    """
+
+    def __init__(self):
+        self.frame_processed = 0
+        self.frame_dropped = 0
+        self.total_processed = 0
+        self.total_dropped = 0
+
+    def configure(self, scene):
+        """Only let the event types `scene` handles into the queue."""
+        allowed = set(ALWAYS_ALLOWED)
+        if scene is not None:
+            allowed.update(scene.handlers)
+
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(allowed))
+
+    def poll(self):
+        """Return this frame's events with MOUSEMOTION coalesced into one."""
+        self.frame_processed = 0
+        self.frame_dropped = 0
+
+        events = []
+        motion_index = None
+        rel_x, rel_y = 0, 0
+
+        for event in pygame.event.get():
+            if event.type == pygame.MOUSEMOTION:
+                rel_x += event.rel[0]
+                rel_y += event.rel[1]
+                if motion_index is not None:
+                    # superseded: the merged motion goes where the last one
+                    # was, so it stays after any clicks in between
+                    events[motion_index] = None
+                    self.frame_dropped += 1
+                    self.total_dropped += 1
+                motion_index = len(events)
+            events.append(event)
+
+        if self.frame_dropped:
+            last = events[motion_index]
+            attrs = dict(last.dict)  # keeps touch, window, ...
+            attrs["rel"] = (rel_x, rel_y)
+            events[motion_index] = pygame.event.Event(pygame.MOUSEMOTION, attrs)
+            events = [event for event in events if event is not None]
+
+        return events
+
+    def dispatch(self, scene, event):
+        """Call the scene's handler for `event`, counting it either way."""
+        handler = scene.handlers.get(event.type) if scene else None
+        if handler is None:
+            self.frame_dropped += 1
+            self.total_dropped += 1
+            return False
+
+        handler(event)
+        self.frame_processed += 1
+        self.total_processed += 1
+        return True
+
+    def consume(self, event):
+        """Count an event the main loop handled itself (quit, Esc)."""
+        self.frame_processed += 1
+        self.total_processed += 1
+
+    def stats(self):
+        return {
+            "frame_processed": self.frame_processed,
+            "frame_dropped": self.frame_dropped,
+            "total_processed": self.total_processed,
+            "total_dropped": self.total_dropped,
+        }
+
+    def format(self):
+        return (
+            f"[events] frame: {self.frame_processed} processed,"
+            f" {self.frame_dropped} dropped | total: {self.total_processed}"
+            f" processed, {self.total_dropped} dropped"
+        )
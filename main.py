@@ -1,10 +1,14 @@
+import argparse
 import sys
 import pygame
 import scenes
+from render import RenderSettings
+from memory import MemoryMonitor
+from quality import QualityController
 
 
 class Game:
-    def __init__(self, width=960, height=540, title="GGJ_2026"):
+    def __init__(self, width=960, height=540, title="GGJ_2026", render_scale=1.0, smooth=False, memory_budget_mb=64, memory_trace=False, adaptive=True):
         pygame.init()
         self.width = width
         self.height = height
@@ -12,29 +16,74 @@ class Game:
         pygame.display.set_caption(title)
         self.clock = pygame.time.Clock()
         # SceneManager will instantiate the initial scene
-        self.manager = scenes.SceneManager(scenes.MenuScene, self.screen)
+        self.manager = scenes.SceneManager(
+            scenes.MenuScene,
+            self.screen,
+            render=RenderSettings(render_scale, smooth),
+            memory=MemoryMonitor(memory_budget_mb * 1024 * 1024, memory_trace),
+        )
+        # steps render quality down/up to keep frames within budget
+        self.quality = (
+            QualityController(self.manager.render, budget_ms=1000 / 60)
+            if adaptive else None
+        )
 
     def run(self):
         running = True
         while running:
             dt = self.clock.tick(60) / 1000.0
-            for event in pygame.event.get():
+            if self.quality:
+                # work time of the last frame, without the frame cap's sleep
+                self.quality.record(self.clock.get_rawtime())
+            events = self.manager.events
+            for event in events.poll():
                 if event.type == pygame.QUIT:
+                    events.consume(event)
                     running = False
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    events.consume(event)
                     running = False
                 else:
-                    if self.manager.current_scene:
-                        self.manager.current_scene.handle_event(event)
+                    # re-read each time: a handler may have changed scene
+                    events.dispatch(self.manager.current_scene, event)
 
             if self.manager.current_scene:
                 self.manager.current_scene.run_frame(self.screen, dt)
 
             pygame.display.flip()
 
+        print(self.manager.events.format())
         pygame.quit()
         sys.exit()
 
 
 if __name__ == "__main__":
-    Game().run()
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--render-scale", type=float, default=1.0,
+        help="internal resolution of the game world, e.g. 0.5 for half",
+    )
+    parser.add_argument(
+        "--smooth", action="store_true",
+        help="smooth scaling instead of nearest neighbour",
+    )
+    parser.add_argument(
+        "--memory-budget", type=int, default=64,
+        help="MB of cached textures, sounds and fonts before cold ones are evicted",
+    )
+    parser.add_argument(
+        "--memory-trace", action="store_true",
+        help="track the Python heap with tracemalloc on every scene change",
+    )
+    parser.add_argument(
+        "--no-adaptive", action="store_true",
+        help="keep render quality fixed instead of adapting it to frame time",
+    )
+    args = parser.parse_args()
+    Game(
+        render_scale=args.render_scale,
+        smooth=args.smooth,
+        memory_budget_mb=args.memory_budget,
+        memory_trace=args.memory_trace,
+        adaptive=not args.no_adaptive,
+    ).run()
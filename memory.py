@@ -0,0 +1,167 @@
+from collections import deque
+import gc
+import tracemalloc
+import pygame as pyg
+from assets import font_cache, font_file_bytes, sound_bytes, sound_cache, surface_bytes
+from render import sprite_cache
+
+
+# scene attributes that are not the scene's own
+_SHARED = ("manager", "session")
+# values that never hold assets, not worth queueing
+_PLAIN = {int, float, bool, str, type(None), pyg.Rect}
+
+
+def _asset_size(obj):
+    """(kind, bytes) for a Surface, Sound or Font, None for anything else."""
+    if isinstance(obj, pyg.Surface):
+        return "surfaces", surface_bytes(obj)
+    if isinstance(obj, pyg.mixer.Sound):
+        return "sounds", sound_bytes(obj)
+    if isinstance(obj, pyg.font.Font):
+        return "fonts", font_file_bytes(font_cache.file_of(obj))
+    return None
+
+
+class MemoryMonitor:
+    """Accounts for the memory held by scenes and the shared asset caches.
+
+    `report` walks a scene's attributes (and the widgets/entities they hold)
+    for Surfaces, Sounds and Fonts, counting each object once, and adds the
+    size of every asset cache. Font bytes are the font file's size, counted
+    once per file. With `trace` on, tracemalloc also measures the Python
+    heap, and each report records the growth since the last time the same
+    scene class was shown: steady growth across play-again cycles is a
+    leak. `enforce` evicts the coldest cached assets that nothing else
+    uses, across all caches, until they fit in `budget_bytes`; assets in
+    use stay, so the budget can be exceeded while a scene holds them.
+    """
+
+    def __init__(self, budget_bytes=64 * 1024 * 1024, trace=False, caches=None, history=100):
+        self.budget_bytes = budget_bytes
+        self.trace = trace
+        self.caches = caches or [sprite_cache, sound_cache, font_cache]
+        self.history = deque(maxlen=history)
+        self._last_heap = {}
+
+        if trace and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def cached_bytes(self):
+        return sum(cache.bytes for cache in self.caches)
+
+    def enforce(self):
+        """Evict the least recently used cached assets until under budget."""
+        evicted = 0
+        if self.cached_bytes() <= self.budget_bytes:
+            return evicted
+
+        # oldest first across every cache, see AssetCache.evict
+        candidates = sorted(
+            (stamp, i, key)
+            for i, cache in enumerate(self.caches)
+            for key, stamp in cache.use_stamps()
+        )
+        for _, i, key in candidates:
+            if self.cached_bytes() <= self.budget_bytes:
+                break
+            if self.caches[i].evict(key):
+                evicted += 1
+        return evicted
+
+    def scene_assets(self, scene):
+        """Bytes held by `scene` per asset kind, each object counted once."""
+        totals = {"surfaces": 0, "sounds": 0, "fonts": 0}
+        for _ in self.scene_asset_steps(scene, totals):
+            pass
+        return totals
+
+    def scene_asset_steps(self, scene, totals, batch=64):
+        """`scene_assets` into `totals`, yielding every `batch` objects so a
+        big level can be walked over several frames."""
+        seen = set()
+        # breadth first, so every object is first met at its lowest depth
+        queue = deque([(scene, 0)])
+
+        visited = 0
+        while queue:
+            visited += 1
+            if visited % batch == 0:
+                yield
+            obj, depth = queue.popleft()
+            if id(obj) in seen:
+                continue
+
+            size = _asset_size(obj)
+            if size:
+                seen.add(id(obj))
+                if size[0] == "fonts":
+                    # sizes of one font file share it
+                    font_file = ("font file", font_cache.file_of(obj))
+                    if font_file in seen:
+                        continue
+                    seen.add(font_file)
+                totals[size[0]] += size[1]
+                continue
+            if depth >= 3:
+                continue  # not expanded, so not marked seen either
+            seen.add(id(obj))
+
+            if isinstance(obj, (list, tuple, set)):
+                children = obj
+            elif isinstance(obj, dict):
+                children = obj.values()
+            elif hasattr(obj, "__dict__") and not callable(obj):
+                # the manager and Session outlive the scene; the Session's
+                # decoy pool would otherwise be walked for every scene
+                children = [v for k, v in vars(obj).items() if k not in _SHARED]
+            else:
+                continue
+            queue.extend((child, depth + 1) for child in children if type(child) not in _PLAIN)
+
+    def report(self, scene, scene_bytes=None):
+        """Report on `scene`; `scene_bytes` when already walked, see
+        scene_asset_steps."""
+        name = type(scene).__name__
+        report = {
+            "scene": name,
+            "scene_bytes": scene_bytes or self.scene_assets(scene),
+            "cache_bytes": {cache.name: cache.bytes for cache in self.caches},
+            "evicted": self.enforce(),
+        }
+
+        if self.trace:
+            # scenes hold bound methods of themselves (handlers, callbacks),
+            # so a replaced scene is only freed by the cycle collector
+            gc.collect()
+            heap, peak = tracemalloc.get_traced_memory()
+            report["heap_bytes"] = heap
+            report["heap_peak"] = peak
+            report["heap_growth"] = heap - self._last_heap.get(name, heap)
+            self._last_heap[name] = heap
+
+        self.history.append(report)
+        return report
+
+    def asset_report(self):
+        """Bytes per cached asset, largest first."""
+        rows = []
+        for cache in self.caches:
+            for key, nbytes in cache.asset_bytes().items():
+                rows.append((cache.name, key, nbytes))
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows
+
+    def format(self, report):
+        kb = lambda n: f"{n / 1024:.0f}KB"
+        scene = ", ".join(f"{k} {kb(v)}" for k, v in report["scene_bytes"].items())
+        caches = ", ".join(f"{k} {kb(v)}" for k, v in report["cache_bytes"].items())
+        line = f"[memory] {report['scene']}: {scene} | cached: {caches}"
+        if report["evicted"]:
+            line += f" | evicted {report['evicted']}"
+        if "heap_bytes" in report:
+            line += (
+                f" | heap {kb(report['heap_bytes'])}"
+                f" ({report['heap_growth']:+d} B since last {report['scene']})"
+            )
+        return line
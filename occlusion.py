@@ -0,0 +1,114 @@
+import pygame as pyg
+from assets import composite_key, sprite_key
+
+
+class OcclusionCuller:
+    """Finds entities that are completely hidden by entities drawn after them.
+
+    Entities are drawn in list order, so an entity can only be covered by
+    later ones. Its visible area is its own (non-transparent) pixel mask with
+    the fully opaque pixels of every later overlapping entity erased. When
+    that area is at most `threshold` pixels, `entity.culled` is set and the
+    scene skips drawing it.
+
+    The index is the entities and their rects in draw order; overlaps are
+    found with `Rect.collidelistall` on the slice after (or before) an
+    entity. The lists are refilled in place, so a culler kept by a Session
+    is reused from round to round. Masks come from the prebuilt `store`
+    when it has them.
+    """
+
+    def __init__(self, threshold=0, store=None):
+        self.threshold = threshold
+        self.store = store
+
+        self._masks = {}
+        self._scratch = {}
+        self._entities = []
+        self._rects = []
+
+        self.culled_count = 0
+        self.culled_blits = 0
+
+    def _get_masks(self, entity):
+        """(visible, opaque) masks for the entity's sprite, shared per texture."""
+        key = (entity.base_texture, entity.mask_texture, entity.scale)
+        masks = self._masks.get(key)
+        if masks is None and self.store:
+            if entity.mask_texture:
+                store_key = composite_key(entity.base_texture, entity.mask_texture, entity.scale)
+            else:
+                store_key = sprite_key(entity.base_texture, entity.scale)
+            masks = self.store.masks(store_key)
+            if masks is not None:
+                self._masks[key] = masks
+        if masks is None:
+            visible = pyg.mask.from_surface(entity.scaled_base, 0)
+            opaque = pyg.mask.from_surface(entity.scaled_base, 254)
+            if entity.scaled_mask:
+                visible.draw(pyg.mask.from_surface(entity.scaled_mask, 0), (0, 0))
+                opaque.draw(pyg.mask.from_surface(entity.scaled_mask, 254), (0, 0))
+            masks = self._masks[key] = (visible, opaque)
+        return masks
+
+    def _blits(self, entity):
+        return 2 if entity.scaled_mask else 1
+
+    def _evaluate(self, index):
+        entity = self._entities[index]
+        own = self._get_masks(entity)[0]
+        # reused work mask; Mask.copy() leaks its memory in pygame 2.6
+        visible = self._scratch.get(own.get_size())
+        if visible is None:
+            visible = self._scratch[own.get_size()] = pyg.mask.Mask(own.get_size())
+        visible.clear()
+        visible.draw(own, (0, 0))
+        x, y = entity.rect.topleft
+
+        later = index + 1
+        for j in entity.rect.collidelistall(self._rects[later:]):
+            other = self._entities[later + j]
+            opaque = self._get_masks(other)[1]
+            visible.erase(opaque, (other.rect.x - x, other.rect.y - y))
+            if visible.count() <= self.threshold:
+                break
+
+        culled = visible.count() <= self.threshold
+        if culled != entity.culled:
+            entity.culled = culled
+            sign = 1 if culled else -1
+            self.culled_count += sign
+            self.culled_blits += sign * self._blits(entity)
+
+    def build(self, entities):
+        """Index `entities` (in draw order) and mark the hidden ones."""
+        for _ in self.build_steps(entities):
+            pass
+
+    def build_steps(self, entities):
+        """`build`, one entity per step, so it can be spread over frames."""
+        self._entities[:] = entities
+        self._rects[:] = [entity.rect for entity in entities]
+        self.culled_count = 0
+        self.culled_blits = 0
+
+        for index, entity in enumerate(entities):
+            entity.culled = False
+            self._evaluate(index)
+            yield
+
+    def remove(self, entity):
+        """Forget `entity` and re-check only the culled entities under it."""
+        index = self._entities.index(entity)
+        del self._entities[index]
+        del self._rects[index]
+
+        if entity.culled:
+            self.culled_count -= 1
+            self.culled_blits -= self._blits(entity)
+            entity.culled = False
+
+        # entities before it keep their index
+        for j in entity.rect.collidelistall(self._rects[:index]):
+            if self._entities[j].culled:
+                self._evaluate(j)
@@ -0,0 +1,178 @@
+"""Asset build step: preprocess every texture the game uses into .asset_cache/.
+
+Run `python prebuild.py` after changing any PNG. Each texture is decoded,
+scaled to the factors the game draws it at, Waldo base/mask pairs are
+composed into one sprite, and for every output the visible/opaque masks and
+a few similarity features are computed. Work is spread over a process pool;
+outputs are named by a hash of their sources, so only changed assets are
+rebuilt. All outputs are then concatenated into one pack file, which the
+game memory-maps once through assets.AssetStore.
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame as pyg
+from assets import (
+    BASES, CACHE_DIR, MASKS, PACK_FILE, TEXTURES, composite_key, content_hash, sprite_key,
+)
+
+
+# entity scale 2, and 2 * render scale 0.75 / 0.5
+SCALES = (1, 1.5, 2)
+# LearnScene shows these two big
+EXTRA_SCALES = {"Assets/baldo_01.png": (12,), "Assets/base_5.png": (12,)}
+
+_VISIBLE = bytes([0] + [1] * 255)
+_OPAQUE = bytes([0] * 255 + [1])
+
+
+def jobs():
+    """(key, sources, scale) for every output the game can ask for."""
+    for path in TEXTURES:
+        for scale in SCALES + EXTRA_SCALES.get(path, ()):
+            yield sprite_key(path, scale), [path], scale
+    for base in BASES:
+        for mask in MASKS:
+            for scale in SCALES:
+                yield composite_key(base, mask, scale), [base, mask], scale
+
+
+def build_one(job):
+    """Worker: render one output, write its files, return its index entry."""
+    key, sources, scale, digest, cache_dir = job
+
+    image = pyg.image.load(sources[0])
+    if len(sources) > 1:
+        composed = pyg.Surface(image.get_size(), pyg.SRCALPHA)
+        composed.blit(image, (0, 0))
+        composed.blit(pyg.image.load(sources[1]), (0, 0))
+        image = composed
+    if scale != 1:
+        image = pyg.transform.scale_by(image, scale)
+
+    raw = pyg.image.tobytes(image, "BGRA")
+    alpha = raw[3::4]
+    visible = alpha.translate(_VISIBLE)
+    opaque = alpha.translate(_OPAQUE)
+
+    for suffix, data in ((".bgra", raw), (".mask", visible + opaque)):
+        path = os.path.join(cache_dir, digest + suffix)
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+
+    r, g, b, _ = pyg.transform.average_color(image, consider_alpha=True)
+    coverage = visible.count(1) / len(visible)
+    return key, {
+        "hash": digest,
+        "sources": sources,
+        "scale": scale,
+        "size": list(image.get_size()),
+        "features": [r, g, b, round(coverage, 4)],
+    }
+
+
+def similarity(a, b):
+    """1.0 for identical features, towards 0.0 the more they differ."""
+    colour = sum(abs(x - y) for x, y in zip(a[:3], b[:3])) / (3 * 255)
+    return round(1 - (colour + abs(a[3] - b[3])) / 2, 4)
+
+
+def build(cache_dir=CACHE_DIR, workers=None):
+    start = time.perf_counter()
+    os.makedirs(cache_dir, exist_ok=True)
+    index_path = os.path.join(cache_dir, "index.json")
+    old = {}
+    if os.path.exists(index_path):
+        with open(index_path) as f:
+            old = json.load(f).get("entries", {})
+
+    entries, todo = {}, []
+    for key, sources, scale in jobs():
+        digest = content_hash(sources, scale)
+        cached = old.get(key)
+        if (
+            cached and cached["hash"] == digest
+            and os.path.exists(os.path.join(cache_dir, digest + ".bgra"))
+            and os.path.exists(os.path.join(cache_dir, digest + ".mask"))
+        ):
+            entries[key] = cached
+        else:
+            todo.append((key, sources, scale, digest, cache_dir))
+
+    hits = len(entries)
+    if todo:
+        with ProcessPoolExecutor(workers) as pool:
+            for key, entry in pool.map(build_one, todo, chunksize=8):
+                entries[key] = entry
+
+    # how much each Waldo variant looks like Baldo, at entity scale
+    baldo = entries[sprite_key("Assets/baldo_01.png", 2)]["features"]
+    waldo_likeness = {
+        key: similarity(entry["features"], baldo)
+        for key, entry in entries.items()
+        if "+" in key and entry["scale"] == 2
+    }
+
+    # one pack of every output, so the game maps a single file
+    pack_path = os.path.join(cache_dir, PACK_FILE)
+    offset = 0
+    with open(pack_path + ".tmp", "wb") as pack:
+        for key in sorted(entries):
+            entry = entries[key]
+            for suffix, field in ((".bgra", "offset"), (".mask", "mask_offset")):
+                with open(os.path.join(cache_dir, entry["hash"] + suffix), "rb") as f:
+                    data = f.read()
+                pack.write(data)
+                entry[field] = offset
+                offset += len(data)
+    os.replace(pack_path + ".tmp", pack_path)
+
+    with open(index_path + ".tmp", "w") as f:
+        json.dump({
+            "pack_size": offset,
+            "entries": entries,
+            "similarity_to_baldo": waldo_likeness,
+        }, f, indent=1)
+    os.replace(index_path + ".tmp", index_path)
+
+    # drop files no entry points at any more
+    live = {entry["hash"] for entry in entries.values()}
+    removed = 0
+    for name in os.listdir(cache_dir):
+        digest, ext = os.path.splitext(name)
+        if ext in (".bgra", ".mask") and digest not in live:
+            os.remove(os.path.join(cache_dir, name))
+            removed += 1
+
+    elapsed = time.perf_counter() - start
+    return {
+        "outputs": len(entries),
+        "hits": hits,
+        "built": len(todo),
+        "removed": removed,
+        "seconds": elapsed,
+        "most_baldo_like": sorted(waldo_likeness.items(), key=lambda kv: -kv[1])[:3],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+
+    report = build(args.cache_dir, args.jobs)
+    print(
+        f"{report['outputs']} outputs: {report['hits']} cache hits,"
+        f" {report['built']} built, {report['removed']} stale files removed"
+        f" in {report['seconds']:.2f}s"
+    )
+    print("Waldo variants most like Baldo:")
+    for key, score in report["most_baldo_like"]:
+        print(f"  {score:.3f}  {key}")
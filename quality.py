@@ -0,0 +1,154 @@
+from collections import deque
+import statistics
+import time
+
+
+def _no_smooth(settings):
+    settings.smooth = False
+
+
+def _cached_layer(settings):
+    settings.cached_layer = True
+
+
+def _render_scale(scale):
+    def step(settings):
+        settings.render_scale = min(settings.render_scale, scale)
+    return step
+
+
+def _max_decoys(count):
+    def step(settings):
+        settings.max_decoys = count
+    return step
+
+
+# Applied cumulatively on top of the settings the game was started with:
+# level N has every step up to and including N. Steps that change nothing
+# for those settings are left out, see QualityController.
+STEPS = [
+    ("no smooth scaling", _no_smooth),
+    ("cached decoy layer", _cached_layer),
+    ("render scale 0.75", _render_scale(0.75)),
+    ("render scale 0.5", _render_scale(0.5)),
+    ("max 600 decoys next round", _max_decoys(600)),
+]
+
+
+class QualityController:
+    """Steps render quality down when frames go over budget, and back up.
+
+    Each frame's work time (excluding the frame cap's sleep) goes into a
+    rolling window. Once the window is full, a median above
+    `budget_ms * high` steps quality down one level, and a median below
+    `budget_ms * low` steps it back up. The window is cleared after every
+    change so each level is judged on its own frames. An upgrade that is
+    undone by a downgrade within `settle_time` seconds doubles the wait
+    before the next upgrade, so the controller backs off instead of
+    oscillating. Every change
+    is appended to `log` as (seconds since start, old level, new level,
+    median ms). The levels are the STEPS that change something on top of
+    the starting settings, in `steps`.
+    """
+
+    def __init__(
+        self,
+        settings,
+        budget_ms=1000 / 60,
+        window=30,
+        high=0.9,
+        low=0.5,
+        upgrade_delay=2.0,
+        settle_time=5.0,
+        verbose=True,
+    ):
+        self.settings = settings
+        self.base = settings.copy()
+
+        # e.g. "no smooth scaling" is no step down when it was never smooth
+        self.steps = []
+        probe = settings.copy()
+        for name, step in STEPS:
+            before = vars(probe).copy()
+            step(probe)
+            if vars(probe) != before:
+                self.steps.append((name, step))
+        self.budget_ms = budget_ms
+        self.high = high
+        self.low = low
+        self.verbose = verbose
+
+        self.frames = deque(maxlen=window)
+        self.level = 0
+        self.log = []
+
+        self.upgrade_delay = upgrade_delay
+        self.settle_time = settle_time
+        self._start = None
+        self._last_change = None
+        self._last_direction = 0
+
+    def apply(self, level):
+        """Reset the settings to the base ones, then apply `level` steps."""
+        base = self.base
+        self.settings.render_scale = base.render_scale
+        self.settings.smooth = base.smooth
+        self.settings.cached_layer = base.cached_layer
+        self.settings.max_decoys = base.max_decoys
+        for _, step in self.steps[:level]:
+            step(self.settings)
+
+    def _change(self, level, median, now):
+        direction = 1 if level > self.level else -1
+        if (
+            direction == 1
+            and self._last_direction == -1
+            and now - self._last_change < self.settle_time
+        ):
+            # we went up and immediately had to come back: wait longer
+            self.upgrade_delay *= 2
+
+        entry = (now - self._start, self.level, level, median)
+        self.log.append(entry)
+        if self.verbose:
+            step = self.steps[max(level, self.level) - 1][0]
+            action = "down" if direction == 1 else "up"
+            print(
+                f"[quality] {entry[0]:8.2f}s level {self.level} -> {level}"
+                f" ({action}: {step}, median {median:.1f} ms)"
+            )
+
+        self.level = level
+        self.apply(level)
+        self.frames.clear()
+        self._last_change = now
+        self._last_direction = direction
+
+    def record(self, frame_ms, now=None):
+        """Feed the work time of the last frame, in milliseconds."""
+        self.frames.append(frame_ms)
+        if len(self.frames) < self.frames.maxlen:
+            return
+
+        now = time.monotonic() if now is None else now
+        if self._start is None:
+            self._start = self._last_change = now
+        # median: the odd slow frame (like building a level) is not a trend
+        median = statistics.median(self.frames)
+
+        if median > self.budget_ms * self.high and self.level < len(self.steps):
+            self._change(self.level + 1, median, now)
+        elif (
+            median < self.budget_ms * self.low
+            and self.level > 0
+            and now - self._last_change >= self.upgrade_delay
+        ):
+            self._change(self.level - 1, median, now)
+
+    def reversals(self):
+        """How many times the direction of change flipped, from the log."""
+        flips = 0
+        for prev, cur in zip(self.log, self.log[1:]):
+            if (prev[2] > prev[1]) != (cur[2] > cur[1]):
+                flips += 1
+        return flips
@@ -0,0 +1,93 @@
+import pygame as pyg
+from assets import AssetCache, AssetStore, composite_key, sprite_key, surface_bytes
+
+
+class SpriteCache(AssetCache):
+    """Loaded and pre-scaled textures, shared by every entity and scene.
+
+    Entries are keyed by (path, scale, smooth); the original texture is the
+    entry with scale 1. Entries are evicted least recently used first once
+    they exceed `budget_bytes`. Nearest-neighbour entries are memory-mapped
+    from `store` (see prebuild.py) when it has them, instead of being decoded
+    and scaled.
+    """
+
+    name = "sprites"
+
+    def __init__(self, budget_bytes=32 * 1024 * 1024, store=None):
+        super().__init__(budget_bytes)
+        self.store = store
+        self.store_hits = 0
+
+    def load(self, path):
+        return self.get(path)
+
+    def get(self, path, scale=1, smooth=False):
+        if scale == 1:
+            smooth = False
+        key = (path, scale, smooth)
+        image = self._lookup(key)
+        if image is not None:
+            return image
+
+        if not smooth and self.store:
+            image = self.store.surface(sprite_key(path, scale))
+            if image is not None:
+                self.store_hits += 1
+                return self._store(key, image, surface_bytes(image))
+
+        if scale == 1:
+            image = pyg.image.load(path).convert_alpha()
+        elif smooth:
+            image = pyg.transform.smoothscale_by(self.load(path), scale)
+        else:
+            image = pyg.transform.scale_by(self.load(path), scale)
+        return self._store(key, image, surface_bytes(image))
+
+    def get_composite(self, base, mask, scale=1, smooth=False):
+        """`mask` drawn over `base` in one surface, so it takes one blit."""
+        if scale == 1:
+            smooth = False
+        key = ("composite", base, mask, scale, smooth)
+        image = self._lookup(key)
+        if image is not None:
+            return image
+
+        if not smooth and self.store:
+            image = self.store.surface(composite_key(base, mask, scale))
+            if image is not None:
+                self.store_hits += 1
+                return self._store(key, image, surface_bytes(image))
+
+        base_image = self.get(base, scale, smooth)
+        image = pyg.Surface(base_image.get_size(), pyg.SRCALPHA)
+        image.blit(base_image, (0, 0))
+        image.blit(self.get(mask, scale, smooth), (0, 0))
+        return self._store(key, image, surface_bytes(image))
+
+
+class RenderSettings:
+    """How the game world is rendered.
+
+    `render_scale` < 1 draws the world into a smaller internal surface that
+    is then stretched to the screen, trading sharpness for frame rate. UI is
+    always drawn at full resolution. `smooth` picks smoothscale over nearest
+    neighbour, both for sprites and for the final stretch. `cached_layer`
+    draws the decoys once into a layer that is only redrawn when one is
+    removed. `max_decoys` caps the decoy count of the next level built.
+    """
+
+    def __init__(self, render_scale=1.0, smooth=False, cached_layer=False, max_decoys=None):
+        self.render_scale = render_scale
+        self.smooth = smooth
+        self.cached_layer = cached_layer
+        self.max_decoys = max_decoys
+
+    def copy(self):
+        return RenderSettings(
+            self.render_scale, self.smooth, self.cached_layer, self.max_decoys
+        )
+
+
+# shared by every entity, so each texture is decoded and scaled once
+sprite_cache = SpriteCache(store=AssetStore())
@@ -1,7 +1,13 @@
 import pygame
 from ui_elements import *
 from entity import *
+from events import EventPipeline
+from render import RenderSettings
+from assets import font_cache
+from memory import MemoryMonitor
+from session import Session
 import random
+import time
 
 
 class SceneManager:
@@ -10,9 +16,13 @@ class SceneManager:
     The manager ensures only one active scene instance exists at a time.
     """
 
-    def __init__(self, initial_scene_cls, screen, *args, **kwargs):
+    def __init__(self, initial_scene_cls, screen, *args, render=None, memory=None, session=None, **kwargs):
         self.screen = screen
         self.current_scene = None
+        self.events = EventPipeline()
+        self.render = render or RenderSettings()
+        self.memory = memory or MemoryMonitor()
+        self.session = session or Session()
         self.change_scene(initial_scene_cls, *args, **kwargs)
 
     def change_scene(self, scene_cls, *args, **kwargs):
@@ -29,22 +39,33 @@ class SceneManager:
 
         # instantiate new scene, giving it a reference to this manager
         self.current_scene = scene_cls(self, *args, **kwargs)
+        self.events.configure(self.current_scene)
         try:
             self.current_scene.start()
         except Exception:
             pass
 
+        # a scene still building its level reports once it is built
+        if getattr(self.current_scene, "builder", None) is None:
+            self.report_memory(self.current_scene)
+
+    def report_memory(self, scene, scene_bytes=None):
+        print(self.memory.format(self.memory.report(scene, scene_bytes)))
+
 
 class Scene:
     """Base scene class.
 
-    Subclass this and override `start`, `stop`, `handle_event`, `update`, and
-    `draw` as needed. The main game loop will call `run_frame` each tick.
+    Subclass this and override `start`, `stop`, `update`, and `draw` as
+    needed. Register event handlers in `self.handlers` (event type ->
+    callable); only those event types are let through while the scene is
+    active. The main game loop will call `run_frame` each tick.
     """
 
     def __init__(self, manager):
         self.manager = manager
         self._running = True
+        self.handlers = {}
 
     def start(self):
         """Called when the scene becomes active."""
@@ -55,8 +76,10 @@ class Scene:
         self._running = False
 
     def handle_event(self, event):
-        """Handle a single pygame event forwarded from the main loop."""
-        pass
+        """Handle a single pygame event through the `handlers` table."""
+        handler = self.handlers.get(event.type)
+        if handler:
+            handler(event)
 
     def update(self, dt):
         """Update scene state. `dt` is seconds since last frame."""
@@ -76,26 +99,30 @@ class MenuScene(Scene):
     def __init__(self, manager):
         super().__init__(manager)
         pygame.font.init()
-        self.font = pygame.font.SysFont(None, 48)
+        self.font = font_cache.get(48)
 
                 # create three buttons using ui_elements.Button
         w, h = self.manager.screen.get_size()
         btn_w, btn_h = 320, 60
         cx = (w - btn_w) // 2
         start_y = (h // 2) - btn_h
-        self.btns = []
+        self.ui = UIContainer()
         
-        self.play_btn = Button(cx, start_y, btn_w, btn_h, text="Play", font_size=36, bg_color=(0, 0, 0), on_click=self.start_game)
-        self.instruct = Button(cx, start_y + btn_h + 12, btn_w, btn_h, text= "How to Play", font_size=36, bg_color=(0,0,0), on_click=self.learn)
-        self.credits_btn = Button(cx, start_y + (btn_h + 12) * 2, btn_w, btn_h, text="Credits", font_size=36, bg_color=(0, 0, 0), on_click=self.show_credits)
-        self.quit_btn = Button(cx, start_y + (btn_h + 12) * 3, btn_w, btn_h, text="Quit", font_size=36, bg_color=(0, 0, 0), on_click=self.quit_game)
-        self.btns.append(self.play_btn)
-        self.btns.append(self.credits_btn)
-        self.btns.append(self.quit_btn)
+        self.play_btn = self.ui.add(Button(cx, start_y, btn_w, btn_h, text="Play", font_size=36, bg_color=(0, 0, 0), on_click=self.start_game))
+        self.instruct = self.ui.add(Button(cx, start_y + btn_h + 12, btn_w, btn_h, text= "How to Play", font_size=36, bg_color=(0,0,0), on_click=self.learn))
+        self.credits_btn = self.ui.add(Button(cx, start_y + (btn_h + 12) * 2, btn_w, btn_h, text="Credits", font_size=36, bg_color=(0, 0, 0), on_click=self.show_credits))
+        self.quit_btn = self.ui.add(Button(cx, start_y + (btn_h + 12) * 3, btn_w, btn_h, text="Quit", font_size=36, bg_color=(0, 0, 0), on_click=self.quit_game))
+
+        # title never changes, render it once
+        self.title = self.font.render("Where's Baldo", True, (230, 230, 230))
+        self.title_rect = self.title.get_rect(center=(w // 2, h // 4))
+
+        self.handlers.update(self.ui.handlers())
+        self.handlers[pygame.KEYDOWN] = self.on_key_down
         
     def start_game(self):
-        from scenes import TestGameScene
-        self.manager.change_scene(TestGameScene)
+        from scenes import BetterScene
+        self.manager.change_scene(BetterScene)
     
     def show_credits(self):
         from scenes import CreditsScene
@@ -111,39 +138,13 @@ class MenuScene(Scene):
     def start(self):
         pass
 
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            print("Key down")
-            if event.key == pygame.K_RETURN:
-                # switch to TestGameScene
-                from scenes import TestGameScene
-
-                self.manager.change_scene(TestGameScene)
+    def on_key_down(self, event):
+        print("Key down")
+        if event.key == pygame.K_RETURN:
+            # switch to TestGameScene
+            from scenes import TestGameScene
 
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            print(" Thing (mouse) down", event.pos)
-                    
-            if self.play_btn.on_click(event):
-                print('test')
-                from scenes import BetterScene
-
-                self.manager.change_scene(BetterScene)
-                return
-            if self.instruct.on_click(event):
-                from scenes import LearnScene
-                
-                self.manager.change_scene(LearnScene)
-                return
-            if self.credits_btn.on_click(event):
-                print('test2')
-                from scenes import CreditsScene
-
-                self.manager.change_scene(CreditsScene)
-                return
-            if self.quit_btn.on_click(event):
-                # post a quit event so main loop handles shutdown
-                pygame.event.post(pygame.event.Event(pygame.QUIT))
-                return
+            self.manager.change_scene(TestGameScene)
 
     def update(self, dt):
         pass
@@ -151,15 +152,10 @@ class MenuScene(Scene):
     def draw(self, surface):
         surface.fill((30, 30, 60))
         # draw title
-        title = self.font.render("Where's Baldo", True, (230, 230, 230))
-        rect = title.get_rect(center=(surface.get_width() // 2, surface.get_height() // 4))
-        surface.blit(title, rect)
+        surface.blit(self.title, self.title_rect)
 
         # draw buttons
-        self.play_btn.draw(surface)
-        self.instruct.draw(surface)
-        self.credits_btn.draw(surface)
-        self.quit_btn.draw(surface)
+        self.ui.draw(surface)
 
 
 
@@ -168,10 +164,11 @@ class TestGameScene(Scene):
     def __init__(self, manager):
         super().__init__(manager)
         pygame.font.init()
-        self.font = pygame.font.SysFont(None, 36)
+        self.font = font_cache.get(36)
         self.time_thingy = 30.0  # Start with 30 seconds
         self.entities = []
         self.progress_bar = ProgressBar(10, 10, 200, 20, max_value=30)
+        self.handlers[pygame.MOUSEBUTTONDOWN] = self.on_mouse_down
 
     def start(self):
         self.time_thingy = 30.0
@@ -185,32 +182,31 @@ class TestGameScene(Scene):
         entities.append(Jar(300, 300, "Assets/base_03.png", "marmalade"))
         return entities
 
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            clicked = False  # Track if any entity was clicked
-            for entity in self.entities:
-                result = entity.on_click(event)
-                if result == ENTITY.BALDO:
-                    self.label = "WELL DONE, U FOUND BALDO"
-                    self.time_thingy = 0  # End the game
-                    self.win = True
-                    clicked = True
-                elif result == ENTITY.JAM:
-                    self.label = "+10 seconds"
-                    self.time_thingy += 10
-                    clicked = True
-                elif result == ENTITY.MARMELADE:
-                    self.label = "+15 seconds"
-                    self.time_thingy += 15
-                    clicked = True
-                elif result == ENTITY.WALDO:
-                    self.label = "get wrekt lol"
-                    self.time_thingy -= 5
-                    clicked = True
-            
-            if not clicked:  # No entity was clicked
-                self.label = "The aim is to find Baldo, Not Waldo"
-                print(" lol u bad at the game")
+    def on_mouse_down(self, event):
+        clicked = False  # Track if any entity was clicked
+        for entity in self.entities:
+            result = entity.on_click(event)
+            if result == ENTITY.BALDO:
+                self.label = "WELL DONE, U FOUND BALDO"
+                self.time_thingy = 0  # End the game
+                self.win = True
+                clicked = True
+            elif result == ENTITY.JAM:
+                self.label = "+10 seconds"
+                self.time_thingy += 10
+                clicked = True
+            elif result == ENTITY.MARMELADE:
+                self.label = "+15 seconds"
+                self.time_thingy += 15
+                clicked = True
+            elif result == ENTITY.WALDO:
+                self.label = "get wrekt lol"
+                self.time_thingy -= 5
+                clicked = True
+        
+        if not clicked:  # No entity was clicked
+            self.label = "The aim is to find Baldo, Not Waldo"
+            print(" lol u bad at the game")
     def update(self, dt):
         if self.time_thingy <= 0:
             if not self.win:
@@ -232,12 +228,22 @@ class TestGameScene(Scene):
         self.progress_bar.draw(surface)
 
 class BetterScene(Scene):
+    # level construction runs at most this long per frame
+    build_slice_ms = 4.0
+
     def __init__(self, manager):
         super().__init__(manager)
         pygame.font.init()
 
-        self.font = pygame.font.SysFont(None, 28)
+        self.font = font_cache.get(28)
         self.entities = []
+        # entities that are not hidden behind later ones, in draw order
+        self.draw_list = []
+
+        # warm state shared with the previous and next rounds
+        self.session = self.manager.session
+        self.rng = self.session.rng
+        self.culler = self.session.culler
 
         self.progress_bar = ProgressBar(10, 10, 200, 20, max_value=30)
         self.progress_label = Label(
@@ -251,42 +257,153 @@ class BetterScene(Scene):
 
         #self.comment_label = Label(10, 520, (0, 0, 0), "U knobhead", 22)
 
+        # shown while the level is being built, a few entities per frame
+        w, h = self.manager.screen.get_size()
+        self.loading_bar = ProgressBar((w - 400) // 2, h // 2, 400, 24, max_value=1)
+        self.loading_bar.set_value(0)
+        self.loading_label = Label(
+            self.loading_bar.rect.x,
+            self.loading_bar.rect.y - 36,
+            color=(255, 255, 255),
+            text="Loading...",
+            font_size=28,
+            bg_color=(128, 64, 0)
+        )
+        self.builder = None
+        self.build_steps = 0
+        self.build_total = 0
+        self.build_frames = 0
+        self.build_worst_slice_ms = 0.0
+        self.build_worst_frame_ms = 0.0
+
         self.label = "Sup"
         self.time_thingy = 30.0
         self.win = False
 
+        # world surface (low-res and/or cached layer), reallocated when the
+        # render settings change and redrawn when dirty
+        self.world = None
+        self.world_settings = None
+        self.world_dirty = True
+
+        self.handlers[pygame.MOUSEBUTTONDOWN] = self.on_mouse_down
+
     def start(self):
+        self.build_started = self.session.begin_round()
         self.time_thingy = 30.0
         self.entities.clear()
-        self.generate_many_macguyvers_and_baldo()
+        self.draw_list = []
+        # built over the next frames by update(), see advance_build
+        self.builder = self.build_level()
+
+    def build_level(self):
+        """Warm the session on the first round, create the level's entities,
+        then cull them, one step each."""
+        # Waldo decoys, capped when the quality controller asks for it
+        count = self.rng.randint(120, 1800)
+        if self.manager.render.max_decoys is not None:
+            count = min(count, self.manager.render.max_decoys)
+        # decoys, 5 jam jars, marmalade and Baldo are created, then culled
+        self.build_total = self.session.warm_step_count() + 2 * (count + 7)
+
+        yield from self.session.warm_steps()
+        yield from self.generate_many_macguyvers_and_baldo(count)
+        yield from self.culler.build_steps(self.entities)
+
+        # the memory report walks every entity, in steps too (not counted)
+        self.scene_bytes = {"surfaces": 0, "sounds": 0, "fonts": 0}
+        yield from self.manager.memory.scene_asset_steps(self, self.scene_bytes)
+
+    def advance_build(self, budget_ms=None):
+        """Run level construction for up to `budget_ms` (to the end when
+        None). Returns True once the level is built."""
+        start = time.perf_counter()
+        deadline = None if budget_ms is None else start + budget_ms / 1000
+        for _ in self.builder:
+            self.build_steps += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        else:
+            self.finish_build()
+            if budget_ms is None:
+                self.record_build()  # no frames to wait for
+
+        slice_ms = (time.perf_counter() - start) * 1000
+        self.build_worst_slice_ms = max(self.build_worst_slice_ms, slice_ms)
+        if self.build_total:
+            self.loading_bar.set_value(self.build_steps / self.build_total)
+        return self.builder is None
+
+    def finish_build(self):
+        self.builder = None
+        self.draw_list = [e for e in self.entities if not e.culled]
+        self.world_dirty = True
+
+    def run_frame(self, surface, dt):
+        if self.builder is None:
+            return super().run_frame(surface, dt)
+
+        # a construction frame: time all of it, the slice and the draw
+        start = time.perf_counter()
+        super().run_frame(surface, dt)
+        frame_ms = (time.perf_counter() - start) * 1000
+        self.build_worst_frame_ms = max(self.build_worst_frame_ms, frame_ms)
+        if self.builder is None:
+            self.record_build()
+
+    def record_build(self):
+        """Log the finished build and report the level's memory."""
+        self.session.end_round_setup(self.build_started, self.build_worst_frame_ms)
+        print(
+            f"Level built in {self.session.setup_times[-1] * 1000:.0f} ms"
+            f" over {self.build_frames} frames, worst slice"
+            f" {self.build_worst_slice_ms:.1f} ms, worst frame"
+            f" {self.build_worst_frame_ms:.1f} ms"
+        )
+        print(
+            f"Occlusion: culled {self.culler.culled_count}/{len(self.entities)}"
+            f" entities, {self.culler.culled_blits} blits per frame"
+        )
+        self.manager.report_memory(self, self.scene_bytes)
 
     def get_random_pos(self):
-        x = random.randint(0, 950)
-        y = random.randint(3, 539)
+        x = self.rng.randint(0, 950)
+        y = self.rng.randint(3, 539)
         return x, y
 
-    def generate_many_macguyvers_and_baldo(self):
-        # Waldo decoys
-        for _ in range(random.randint(120, 1800)):
-            x, y = self.get_random_pos()
-            self.entities.append(Waldo(x, y))
+    def generate_many_macguyvers_and_baldo(self, count):
+        """Add `count` decoys and the level's other entities, yielding after
+        each one."""
+        for waldo in self.session.waldos(count, self.get_random_pos):
+            self.entities.append(waldo)
+            yield
 
         # Jam jars
         for _ in range(3,8):
             x, y = self.get_random_pos()
-            self.entities.append(Jar(x, y, ENTITY.JAM))
+            self.entities.append(Jar(x, y, ENTITY.JAM, sprites=self.session.sprites))
+            yield
 
         # Marmalade jar
         x, y = self.get_random_pos()
-        self.entities.append(Jar(x, y, ENTITY.MARMELADE))
+        self.entities.append(Jar(x, y, ENTITY.MARMELADE, sprites=self.session.sprites))
+        yield
 
         # Baldo (win condition)
         x, y = self.get_random_pos()
-        self.entities.append(Baldo(x, y))
+        self.entities.append(Baldo(x, y, sprites=self.session.sprites))
+        yield
 
-    def handle_event(self, event):
-        if event.type != pygame.MOUSEBUTTONDOWN:
-            return
+    def remove_entity(self, entity):
+        self.entities.remove(entity)
+        self.culler.remove(entity)
+        # may have uncovered entities that were culled
+        self.draw_list = [e for e in self.entities if not e.culled]
+        self.world_dirty = True
+
+    def on_mouse_down(self, event):
+        if self.builder is not None:
+            return  # nothing to click until the level is built
 
         for entity in self.entities[:]:  # iterate over a COPY
             result = entity.on_click(event)
@@ -303,38 +420,43 @@ class BetterScene(Scene):
             elif result == ENTITY.JAM:
                 self.label = "+10 seconds"
                 self.time_thingy += 10
-                self.entities.remove(entity)  # optional: remove jar too
+                self.remove_entity(entity)  # optional: remove jar too
                 return
 
             elif result == ENTITY.MARMELADE:
                 self.label = "+15 seconds"
                 self.time_thingy += 15
-                self.entities.remove(entity)  # optional: remove jar too
+                self.remove_entity(entity)  # optional: remove jar too
                 return
 
             elif result == ENTITY.WALDO:
                 self.label = "One less Waldo"
                 self.time_thingy -= 5
-                self.entities.remove(entity)
+                self.remove_entity(entity)
                 return
 
         self.label = "The aim is to find Baldo, Not Waldo"
 
 
     def update(self, dt):
+        if self.builder is not None:
+            self.build_frames += 1
+            self.advance_build(self.build_slice_ms)
+            return  # the round clock starts once the level is built
+
         if self.time_thingy <= 69 and self.time_thingy >= 67:
-            self.gato = pygame.mixer.Sound("Assets/gato.mp3")
+            self.gato = self.session.sounds.get("Assets/gato.mp3")
             self.gato.play()
         if self.time_thingy <= 0:
             if not self.win:
                 print("Game Over!")
-                self.fail = pyg.mixer.Sound("Assets/bruh.mp3")
+                self.fail = self.session.sounds.get("Assets/bruh.mp3")
                 self.fail.play()
                 
                 from scenes import FailScene
                 self.manager.change_scene(FailScene)
                 return
-            self.win_sound = pygame.mixer.Sound("Assets/win.mp3")    
+            self.win_sound = self.session.sounds.get("Assets/win.mp3")    
             self.win_sound.play()
                 
                 
@@ -348,11 +470,52 @@ class BetterScene(Scene):
         #self.comment_label.set_text(self.label)
         print(" updated labels")
 
+    def get_world_surface(self, surface):
+        render = self.manager.render
+        settings = (render.render_scale, render.smooth)
+        if self.world is None or self.world_settings != settings:
+            w, h = surface.get_size()
+            self.world = self.session.world_surface(
+                (int(w * render.render_scale), int(h * render.render_scale))
+            )
+            self.world_settings = settings
+            self.world_dirty = True
+            for entity in self.entities:
+                entity.set_render_scale(render.render_scale, render.smooth)
+        return self.world
+
     def draw(self, surface):
-        surface.fill((128, 64, 0))
+        render = self.manager.render
 
-        for entity in self.entities:
-            entity.draw(surface)
+        if self.builder is not None:
+            surface.fill((128, 64, 0))
+            self.loading_label.draw(surface)
+            self.loading_bar.draw(surface)
+            return
+
+        if render.render_scale == 1 and not render.cached_layer:
+            surface.fill((128, 64, 0))
+
+            for entity in self.draw_list:
+                entity.draw(surface)
+        else:
+            world = self.get_world_surface(surface)
+
+            # the decoys only change on a click, a cached layer is reused
+            if self.world_dirty or not render.cached_layer:
+                world.fill((128, 64, 0))
+
+                for entity in self.draw_list:
+                    entity.draw_scaled(world)
+                self.world_dirty = False
+
+            # stretch straight into the screen, no intermediate surface
+            if render.render_scale == 1:
+                surface.blit(world, (0, 0))
+            elif render.smooth:
+                pygame.transform.smoothscale(world, surface.get_size(), surface)
+            else:
+                pygame.transform.scale(world, surface.get_size(), surface)
 
         #self.comment_label.draw(surface)
         self.progress_bar.draw(surface)
@@ -369,17 +532,19 @@ class CreditsScene(Scene):
     def __init__(self, manager):
         super().__init__(manager)
         pygame.font.init()
-        self.font = pygame.font.SysFont(None, 28)
+        self.font = font_cache.get(28)
+
+        # return to menu on any key or click
+        self.handlers[pygame.KEYDOWN] = self.back_to_menu
+        self.handlers[pygame.MOUSEBUTTONDOWN] = self.back_to_menu
 
     def start(self):
         pass
 
-    def handle_event(self, event):
-        # return to menu on any key or click
-        if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
-            from scenes import MenuScene
+    def back_to_menu(self, event):
+        from scenes import MenuScene
 
-            self.manager.change_scene(MenuScene)
+        self.manager.change_scene(MenuScene)
 
     def update(self, dt):
         pass
@@ -405,17 +570,17 @@ class CreditsScene(Scene):
 class StartScene(Scene):
     def __init__(self, manager):
         super().__init__(manager)
+        self.handlers[pygame.KEYDOWN] = self.on_key_down
     
     def start(self):
         pass
     
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            match event.type:
-                
-                case pygame.BUTTON_LEFT:
-                    from scenes import TestGameScene
-                    self.manager.change_scene(TestGameScene)
+    def on_key_down(self, event):
+        match event.type:
+            
+            case pygame.BUTTON_LEFT:
+                from scenes import TestGameScene
+                self.manager.change_scene(TestGameScene)
             
     
 class LearnScene(Scene):
@@ -423,23 +588,24 @@ class LearnScene(Scene):
         super().__init__(manager)
         self.slide = 0
         pygame.font.init()
-        self.font = pygame.font.SysFont(None, 28)
+        self.font = font_cache.get(28)
         self.w, self.h = self.manager.screen.get_size()
         self.create_example_guys()
+        self.handlers[pygame.KEYDOWN] = self.on_key_down
     
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            from scenes import MenuScene
+    def on_key_down(self, event):
+        from scenes import MenuScene
             
     def create_example_guys(self):
+        self.sprites = self.manager.session.sprites
         self.baldo_texture_path = "Assets/baldo_01.png"
-        self.baldo_texture = pyg.image.load(self.baldo_texture_path).convert_alpha()
-        self.baldo = Baldo(30, (self.h//2)-(self.baldo_texture.get_height()//2), self.baldo_texture_path)
+        self.baldo_texture = self.sprites.load(self.baldo_texture_path)
+        self.baldo = Baldo(30, (self.h//2)-(self.baldo_texture.get_height()//2), self.baldo_texture_path, sprites=self.sprites)
         
         
         self.waldo_texture_path = "Assets/base_5.png"
-        self.waldo_texture = pyg.image.load(self.waldo_texture_path).convert_alpha()
-        self.waldo = Waldo(self.w-30, (self.h//2)-(self.waldo_texture.get_height()//2))
+        self.waldo_texture = self.sprites.load(self.waldo_texture_path)
+        self.waldo = Waldo(self.w-30, (self.h//2)-(self.waldo_texture.get_height()//2), sprites=self.sprites)
             
     def draw(self, surface):
         surface.fill((20, 20, 20))
@@ -463,9 +629,9 @@ class LearnScene(Scene):
             surface.blit(txt, rect)
             y += 40
         
-        self.big_baldo = pyg.transform.scale_by(self.baldo_texture, 12)
+        self.big_baldo = self.sprites.get(self.baldo_texture_path, 12)
         surface.blit(self.big_baldo, (30,(self.h/2)-(self.baldo_texture.get_height())))
-        self.big_waldo = pyg.transform.scale_by(self.waldo_texture, 12)
+        self.big_waldo = self.sprites.get(self.waldo_texture_path, 12)
         surface.blit(self.big_waldo, (self.w-180,(self.h/2)-(self.waldo_texture.get_height())))
         #pyg.draw.rect(surface, (255,0,0), pyg.Rect(self.big_baldo.rect.x,self.big_baldo.rect.y,self.big_baldo_texture.get_width(),self.baldo_texture.get_height()),2)
         
@@ -476,30 +642,37 @@ class WinScene(Scene):
 
         self.w, self.h = self.manager.screen.get_size()
 
-        self.title_font = pygame.font.SysFont(None, 96)
+        self.title_font = font_cache.get(96)
         self.btn_font_size = 36
 
         btn_w, btn_h = 300, 60
         cx = (self.w - btn_w) // 2
         start_y = self.h // 2 + 20
 
-        self.play_again_btn = Button(
+        self.ui = UIContainer()
+
+        self.play_again_btn = self.ui.add(Button(
             cx, start_y,
             btn_w, btn_h,
             text="Play Again",
             font_size=self.btn_font_size,
             bg_color=(0, 0, 0),
             on_click=self.play_again
-        )
+        ))
 
-        self.menu_btn = Button(
+        self.menu_btn = self.ui.add(Button(
             cx, start_y + btn_h + 15,
             btn_w, btn_h,
             text="Main Menu",
             font_size=self.btn_font_size,
             bg_color=(0, 0, 0),
             on_click=self.go_menu
-        )
+        ))
+
+        self.title = self.title_font.render("YOU WON", True, (255, 255, 255))
+        self.title_rect = self.title.get_rect(center=(self.w // 2, self.h // 2 - 120))
+
+        self.handlers.update(self.ui.handlers())
 
     def play_again(self):
         from scenes import BetterScene
@@ -509,23 +682,13 @@ class WinScene(Scene):
         from scenes import MenuScene
         self.manager.change_scene(MenuScene)
 
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.play_again_btn.on_click(event):
-                self.play_again()
-            elif self.menu_btn.on_click(event):
-                self.go_menu()
-
     def draw(self, surface):
         surface.fill((20, 120, 40))  # celebratory green-ish
 
-        title = self.title_font.render("YOU WON", True, (255, 255, 255))
-        title_rect = title.get_rect(center=(self.w // 2, self.h // 2 - 120))
-        surface.blit(title, title_rect)
+        surface.blit(self.title, self.title_rect)
         
 
-        self.play_again_btn.draw(surface)
-        self.menu_btn.draw(surface)
+        self.ui.draw(surface)
 
 class FailScene(Scene):
     def __init__(self, manager):
@@ -534,8 +697,8 @@ class FailScene(Scene):
 
         self.w, self.h = self.manager.screen.get_size()
 
-        self.title_font = pygame.font.SysFont(None, 96)
-        self.msg_font = pygame.font.SysFont(None, 32)
+        self.title_font = font_cache.get(96)
+        self.msg_font = font_cache.get(32)
         self.btn_font_size = 36
 
         # Some savage mocking lines
@@ -564,23 +727,33 @@ class FailScene(Scene):
         cx = (self.w - btn_w) // 2
         start_y = self.h // 2 + 40
 
-        self.try_again_btn = Button(
+        self.ui = UIContainer()
+
+        self.try_again_btn = self.ui.add(Button(
             cx, start_y,
             btn_w, btn_h,
             text="Try Again",
             font_size=self.btn_font_size,
             bg_color=(0, 0, 0),
             on_click=self.try_again
-        )
+        ))
 
-        self.menu_btn = Button(
+        self.menu_btn = self.ui.add(Button(
             cx, start_y + btn_h + 15,
             btn_w, btn_h,
             text="Main Menu",
             font_size=self.btn_font_size,
             bg_color=(0, 0, 0),
             on_click=self.go_menu
-        )
+        ))
+
+        # title and mocking message are fixed for this scene, render once
+        self.title = self.title_font.render("YOU FAILED", True, (255, 255, 255))
+        self.title_rect = self.title.get_rect(center=(self.w // 2, self.h // 2 - 120))
+        self.msg = self.msg_font.render(self.mock_msg, True, (255, 220, 220))
+        self.msg_rect = self.msg.get_rect(center=(self.w // 2, self.h // 2 - 50))
+
+        self.handlers.update(self.ui.handlers())
 
     def try_again(self):
         from scenes import BetterScene
@@ -591,29 +764,15 @@ class FailScene(Scene):
         self.manager.change_scene(MenuScene)
 
 
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.try_again_btn.on_click(event): # Check collision.
-                from scenes import BetterScene
-                self.manager.change_scene(BetterScene)
-            elif self.menu_btn.on_click(event):
-                from scenes import MenuScene
-                self.manager.change_scene(MenuScene)
-
     def draw(self, surface):
         # Solid red-ish background for failure vibes
         surface.fill((150, 20, 20))
 
         # YOU FAILED title
-        title = self.title_font.render("YOU FAILED", True, (255, 255, 255))
-        title_rect = title.get_rect(center=(self.w // 2, self.h // 2 - 120))
-        surface.blit(title, title_rect)
+        surface.blit(self.title, self.title_rect)
 
         # Mocking message
-        msg = self.msg_font.render(self.mock_msg, True, (255, 220, 220))
-        msg_rect = msg.get_rect(center=(self.w // 2, self.h // 2 - 50))
-        surface.blit(msg, msg_rect)
+        surface.blit(self.msg, self.msg_rect)
 
         # Buttons
-        self.try_again_btn.draw(surface)
-        self.menu_btn.draw(surface)
\ No newline at end of file
+        self.ui.draw(surface)
\ No newline at end of file
@@ -0,0 +1,104 @@
+from collections import deque
+import random
+import time
+import pygame as pyg
+from assets import TEXTURES, sound_cache
+from entity import Waldo
+from occlusion import OcclusionCuller
+from render import sprite_cache
+
+
+SOUNDS = ("Assets/gato.mp3", "Assets/bruh.mp3", "Assets/win.mp3")
+
+
+class Session:
+    """State that outlives a single round of BetterScene.
+
+    Owns the sprite and sound caches the level uses (entities draw from
+    `sprites`; fonts stay in the process-wide font_cache of the UI), the
+    RNG stream levels are laid out from, the occlusion culler (spatial
+    index and masks), a pool of Waldo decoys and the world surface. A new
+    round only re-rolls positions and textures of pooled decoys instead of
+    building everything from scratch. The pool is preallocated to
+    `max_decoys` when the session is warmed. With `pool=False` nothing is
+    warmed and every round creates its decoys anew, as before sessions. How long each
+    level took to build, and its worst frame while building, are kept in
+    `setup_times` (seconds) and `worst_frames` (ms).
+    """
+
+    def __init__(self, seed=None, sprites=sprite_cache, sounds=sound_cache, max_decoys=1800, pool=True):
+        self.rng = random.Random(seed)
+        self.sprites = sprites
+        self.sounds = sounds
+        self.culler = OcclusionCuller(store=sprites.store)
+
+        self.max_decoys = max_decoys
+        self.pool = pool
+        self.waldo_pool = []
+        self._world = None
+        self._warm = False
+
+        self.rounds = 0
+        self.setup_times = deque(maxlen=100)
+        self.worst_frames = deque(maxlen=100)
+
+    def warm(self):
+        """Load every texture (at entity scale) and sound, and fill the decoy
+        pool, once up front."""
+        for _ in self.warm_steps():
+            pass
+
+    def warm_step_count(self):
+        """How many steps warm_steps has to run."""
+        if self._warm or not self.pool:
+            return 0
+        sounds = len(SOUNDS) if pyg.mixer.get_init() else 0
+        return len(TEXTURES) + sounds + max(0, self.max_decoys - len(self.waldo_pool))
+
+    def warm_steps(self):
+        """`warm`, one asset or pooled decoy per step."""
+        if self._warm or not self.pool:
+            return
+        for path in TEXTURES:
+            self.sprites.get(path, 2)
+            yield
+        if pyg.mixer.get_init():
+            for path in SOUNDS:
+                self.sounds.get(path)
+                yield
+
+        # own RNG, so warming does not shift the level layout stream
+        filler = random.Random(0)
+        while len(self.waldo_pool) < self.max_decoys:
+            self.waldo_pool.append(Waldo(0, 0, rng=filler, sprites=self.sprites))
+            yield
+        self._warm = True
+
+    def waldos(self, count, positions):
+        """Yield `count` decoys at the next positions of `positions`,
+        reusing pooled ones first."""
+        pool = self.waldo_pool
+        for i in range(count):
+            x, y = positions()
+            if not self.pool:
+                yield Waldo(x, y, rng=self.rng, sprites=self.sprites)
+                continue
+            if i < len(pool):
+                pool[i].reroll(x, y, self.rng)
+            else:
+                pool.append(Waldo(x, y, rng=self.rng, sprites=self.sprites))
+            yield pool[i]
+
+    def world_surface(self, size):
+        if self._world is None or self._world.get_size() != size:
+            self._world = pyg.Surface(size)
+        return self._world
+
+    def begin_round(self):
+        # the caller warms the session, see warm_steps
+        self.rounds += 1
+        return time.perf_counter()
+
+    def end_round_setup(self, started, worst_frame_ms=0.0):
+        self.setup_times.append(time.perf_counter() - started)
+        self.worst_frames.append(worst_frame_ms)
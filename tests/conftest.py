@@ -0,0 +1,35 @@
+"""Headless SDL, and the repo root on sys.path and as working directory."""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+import pytest
+import scenes
+from session import Session
+
+
+@pytest.fixture
+def screen(monkeypatch):
+    # scenes load Assets/ relative to the repo root
+    monkeypatch.chdir(ROOT)
+    pygame.init()
+    return pygame.display.set_mode((960, 540))
+
+
+@pytest.fixture
+def level(screen):
+    """`level(seed, **session_args)`: a BetterScene with its level built."""
+    def build(seed, **session_args):
+        session = Session(seed, **session_args)
+        manager = scenes.SceneManager(scenes.BetterScene, screen, session=session)
+        scene = manager.current_scene
+        scene.advance_build()  # whole level, not sliced
+        return scene
+    return build
@@ -0,0 +1,93 @@
+import pygame
+from events import EventPipeline
+
+
+class Recorder:
+    """Stand-in scene that only handles mouse motion."""
+
+    def __init__(self):
+        self.received = []
+        self.handlers = {pygame.MOUSEMOTION: self.received.append}
+
+
+def motion(pos, rel):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=rel, buttons=(0, 0, 0))
+
+
+def test_motion_is_coalesced(screen):
+    pipeline = EventPipeline()
+    scene = Recorder()
+    pipeline.configure(scene)
+    pygame.event.clear()
+
+    for i in range(10):
+        pygame.event.post(motion((i, 2 * i), (1, 2)))
+    events = pipeline.poll()
+
+    assert len(events) == 1
+    assert events[0].pos == (9, 18)
+    assert events[0].rel == (10, 20)
+    assert pipeline.frame_dropped == 9
+
+    for event in events:
+        pipeline.dispatch(scene, event)
+    assert scene.received == events
+    assert pipeline.stats() == {
+        "frame_processed": 1,
+        "frame_dropped": 9,
+        "total_processed": 1,
+        "total_dropped": 9,
+    }
+
+
+def test_merged_motion_keeps_order_and_attributes(screen):
+    pipeline = EventPipeline()
+    scene = Recorder()
+    scene.handlers[pygame.MOUSEBUTTONDOWN] = scene.received.append
+    scene.handlers[pygame.MOUSEBUTTONUP] = scene.received.append
+    pipeline.configure(scene)
+    pygame.event.clear()
+
+    pygame.event.post(motion((10, 10), (1, 0)))
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(10, 10), button=1))
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(10, 10), button=1))
+    pygame.event.post(pygame.event.Event(
+        pygame.MOUSEMOTION, pos=(90, 10), rel=(2, 0), buttons=(0, 0, 0), touch=True
+    ))
+    events = pipeline.poll()
+
+    assert [event.type for event in events] == [
+        pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION
+    ]
+    assert events[-1].pos == (90, 10)
+    assert events[-1].rel == (3, 0)
+    assert events[-1].touch is True
+
+
+def test_unhandled_events_are_dropped(screen):
+    pipeline = EventPipeline()
+    scene = Recorder()
+    pipeline.configure(scene)
+    pygame.event.clear()
+
+    # KEYDOWN always reaches the queue, but this scene has no handler for it
+    for key in (pygame.K_a, pygame.K_b, pygame.K_c):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0))
+    pygame.event.post(motion((1, 1), (1, 1)))
+
+    handled = [pipeline.dispatch(scene, event) for event in pipeline.poll()]
+    assert handled.count(False) == 3
+    assert pipeline.frame_processed == 1
+    assert pipeline.frame_dropped == 3
+
+    pipeline.consume(pygame.event.Event(pygame.QUIT))
+    assert pipeline.total_processed == 2
+
+
+def test_blocked_types_never_queue(screen):
+    pipeline = EventPipeline()
+    pipeline.configure(Recorder())
+    pygame.event.clear()
+
+    assert not pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(0, 0), button=1))
+    assert pipeline.poll() == []
@@ -0,0 +1,102 @@
+"""Golden-frame render tests with a frame-time budget per scene.
+
+Every scene is drawn headless to an off-screen Surface and compared to
+tests/golden/<Scene>.png. A pixel matches when each channel is within
+TOLERANCE of the golden one; at most MAX_DIFF_PIXELS may differ. The
+median draw time over FRAMES frames must stay under the scene's budget.
+
+Run `GOLDEN_UPDATE=1 python -m pytest tests` to re-record the images
+after an intended visual change.
+"""
+import os
+import random
+import statistics
+import time
+import pygame
+import pytest
+import scenes
+from conftest import ROOT
+from session import Session
+
+
+GOLDEN_DIR = os.path.join(ROOT, "tests", "golden")
+SIZE = (960, 540)
+SEED = 6  # a crowded level: 1700+ decoys
+FRAMES = 20
+
+# per channel, and how many pixels may be off by more than that
+TOLERANCE = 8
+MAX_DIFF_PIXELS = 50
+
+# median draw time in ms; a frame at 60 fps is 16.7 ms
+BUDGETS_MS = {
+    "MenuScene": 2.0,
+    "BetterScene": 12.0,
+    "CreditsScene": 2.0,
+    "LearnScene": 3.0,
+    "WinScene": 2.0,
+    "FailScene": 2.0,
+}
+
+
+@pytest.fixture
+def manager(screen):
+    # FailScene and the LearnScene Waldo draw from the global RNG
+    random.seed(SEED)
+    return scenes.SceneManager(scenes.MenuScene, screen, session=Session(SEED))
+
+
+def diff_pixels(a, b):
+    """Pixels where some channel of `a` and `b` differs by more than TOLERANCE."""
+    # saturating subtract both ways and add: |a - b| per channel
+    diff = a.copy()
+    diff.blit(b, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+    back = b.copy()
+    back.blit(a, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+    diff.blit(back, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+
+    tolerance = (TOLERANCE + 1, TOLERANCE + 1, TOLERANCE + 1, 255)
+    close = pygame.mask.from_threshold(diff, (0, 0, 0), tolerance)
+    return a.get_width() * a.get_height() - close.count()
+
+
+def draw_times(scene, surface):
+    scene.draw(surface)  # warm up caches
+    times = []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        scene.draw(surface)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+@pytest.mark.parametrize("name", list(BUDGETS_MS))
+def test_scene_frame(manager, name):
+    manager.change_scene(getattr(scenes, name))
+    if getattr(manager.current_scene, "builder", None) is not None:
+        manager.current_scene.advance_build()  # whole level, not sliced
+    surface = pygame.Surface(SIZE)
+    times = draw_times(manager.current_scene, surface)
+
+    path = os.path.join(GOLDEN_DIR, name + ".png")
+    if os.environ.get("GOLDEN_UPDATE"):
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+        pygame.image.save(surface, path)
+    if not os.path.exists(path):
+        pytest.fail(f"no golden image for {name}, record it with GOLDEN_UPDATE=1")
+
+    golden = pygame.image.load(path).convert()
+    assert golden.get_size() == surface.get_size()
+    differing = diff_pixels(surface, golden)
+    if differing > MAX_DIFF_PIXELS:
+        pygame.image.save(surface, os.path.join(GOLDEN_DIR, name + ".actual.png"))
+    assert differing <= MAX_DIFF_PIXELS, (
+        f"{name}: {differing} pixels differ from the golden image,"
+        f" see golden/{name}.actual.png"
+    )
+
+    median = statistics.median(times)
+    assert median <= BUDGETS_MS[name], (
+        f"{name}: median draw {median:.2f} ms over budget {BUDGETS_MS[name]} ms"
+        f" (worst {max(times):.2f} ms)"
+    )
@@ -0,0 +1,34 @@
+import scenes
+from session import Session
+
+
+def test_sliced_build(screen):
+    session = Session(6)
+    manager = scenes.SceneManager(scenes.MenuScene, screen, session=session)
+    manager.change_scene(scenes.BetterScene)
+    scene = manager.current_scene
+    # reported once the level is built, not on the scene change
+    assert manager.memory.history[-1]["scene"] == "MenuScene"
+
+    progress = []
+    while scene.builder is not None:
+        scene.run_frame(screen, 1 / 60)
+        progress.append(scene.loading_bar.current_value)
+        assert scene.time_thingy == 30.0
+    # first round: warming the session (1800 pooled decoys) is on the bar
+    assert scene.build_total > session.max_decoys
+    assert progress[0] > 0
+    assert progress == sorted(progress)
+    assert progress[-1] == 1
+    assert scene.build_frames == len(progress) > 1
+
+    # measured around update + draw, not taken from dt (16.7 ms here)
+    assert session.worst_frames[-1] == scene.build_worst_frame_ms > 0
+    assert scene.build_worst_frame_ms != 1000 / 60
+
+    report = manager.memory.history[-1]
+    assert report["scene"] == "BetterScene"
+    assert report["scene_bytes"]["surfaces"] > 200 * 1024
+
+    scene.run_frame(screen, 1.0)
+    assert scene.time_thingy == 29.0
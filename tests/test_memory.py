@@ -0,0 +1,40 @@
+import scenes
+from assets import font_file_bytes, surface_bytes
+from memory import MemoryMonitor
+from render import SpriteCache
+
+
+def test_scene_assets_counts_level_sprites(level):
+    scene = level(6)
+
+    surfaces = {}
+    for entity in scene.entities:
+        for surf in (entity.scaled_base, entity.render_base):
+            surfaces[id(surf)] = surf
+    level_bytes = sum(surface_bytes(s) for s in surfaces.values())
+    assert len(surfaces) > 50
+
+    counted = MemoryMonitor().scene_assets(scene)
+    assert counted["surfaces"] >= level_bytes
+
+
+def test_font_file_counted_once(screen):
+    manager = scenes.SceneManager(scenes.MenuScene, screen)
+    # title at 48, buttons at 36: two sizes of the default font
+    counted = MemoryMonitor().scene_assets(manager.current_scene)
+    assert counted["fonts"] == font_file_bytes()
+
+
+def test_eviction_skips_assets_in_use(screen):
+    cache = SpriteCache(budget_bytes=None)
+    held = cache.get("Assets/baldo_01.png", 2)
+    cache.get("Assets/jam.png", 2)
+    cache.budget_bytes = 0
+
+    monitor = MemoryMonitor(budget_bytes=0, caches=[cache])
+    evicted = monitor.enforce()
+
+    # the unscaled originals and jam went, the sprite still drawn stays
+    assert evicted == 3
+    assert cache.get("Assets/baldo_01.png", 2) is held
+    assert cache.bytes == surface_bytes(held)
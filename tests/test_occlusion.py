@@ -0,0 +1,34 @@
+import random
+import pygame
+
+
+def frame(scene, entities):
+    surface = pygame.Surface((960, 540))
+    scene.draw_list, draw_list = entities, scene.draw_list
+    scene.draw(surface)
+    scene.draw_list = draw_list
+    return pygame.image.tobytes(surface, "RGB")
+
+
+def test_culling_matches_drawing_everything(level):
+    scene = level(6)
+    assert scene.culler.culled_count > 0
+
+    pick = random.Random(1)
+    for removal in range(300):
+        scene.remove_entity(pick.choice(scene.entities))
+        if removal % 50 == 49:
+            assert frame(scene, scene.draw_list) == frame(scene, scene.entities)
+            assert scene.draw_list == [e for e in scene.entities if not e.culled]
+
+
+def test_rebuilt_culler_agrees_after_removals(level):
+    scene = level(23)
+
+    pick = random.Random(2)
+    for _ in range(200):
+        scene.remove_entity(pick.choice(scene.entities))
+    incremental = [e.culled for e in scene.entities]
+
+    scene.culler.build(scene.entities)
+    assert [e.culled for e in scene.entities] == incremental
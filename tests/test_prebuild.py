@@ -0,0 +1,53 @@
+import os
+import shutil
+import pygame
+import prebuild
+from assets import BASES, TEXTURES, AssetStore, composite_key, sprite_key
+from conftest import ROOT
+
+
+def copy_assets(tmp_path, monkeypatch):
+    """Work on a copy of the textures, so the test can edit them."""
+    os.makedirs(tmp_path / "Assets")
+    for path in TEXTURES:
+        shutil.copy(os.path.join(ROOT, path), tmp_path / path)
+    monkeypatch.chdir(tmp_path)
+    return str(tmp_path / "cache")
+
+
+def repaint(path):
+    image = pygame.image.load(path)
+    image.set_at((0, 0), (1, 2, 3, 255))
+    pygame.image.save(image, path)
+    st = os.stat(path)
+    # in case the new file has the same size and mtime tick
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_second_build_is_all_hits(tmp_path, monkeypatch):
+    cache_dir = copy_assets(tmp_path, monkeypatch)
+    first = prebuild.build(cache_dir, workers=2)
+    assert first["hits"] == 0 and first["built"] == first["outputs"]
+
+    second = prebuild.build(cache_dir, workers=2)
+    assert second["hits"] == second["outputs"] and second["built"] == 0
+    assert second["removed"] == 0
+
+
+def test_changed_source_rebuilds_only_its_outputs(tmp_path, monkeypatch):
+    cache_dir = copy_assets(tmp_path, monkeypatch)
+    prebuild.build(cache_dir, workers=2)
+    mask = "Assets/mask_1.png"
+    repaint(mask)
+
+    # in the same process: the digest memo must notice the edit
+    store = AssetStore(cache_dir)
+    assert store.surface(sprite_key(mask, 2)) is None
+    assert store.surface(composite_key(BASES[0], mask, 2)) is None
+    assert store.surface(sprite_key("Assets/mask_2.png", 2)) is not None
+
+    report = prebuild.build(cache_dir, workers=2)
+    # the mask alone at each scale, and composed onto every base
+    assert report["built"] == len(prebuild.SCALES) * (1 + len(BASES))
+    assert report["removed"] == 2 * report["built"]  # old .bgra and .mask
+    assert AssetStore(cache_dir).surface(sprite_key(mask, 2)) is not None
@@ -0,0 +1,33 @@
+from quality import QualityController
+from render import RenderSettings
+
+
+def over_budget(controller, frames=30, ms=30.0, now=0.0):
+    for _ in range(frames):
+        controller.record(ms, now=now)
+
+
+def test_no_op_steps_are_skipped():
+    settings = RenderSettings(render_scale=0.75)
+    controller = QualityController(settings, verbose=False)
+
+    names = [name for name, _ in controller.steps]
+    assert "no smooth scaling" not in names
+    assert "render scale 0.75" not in names
+
+    # the first step down changes something straight away
+    over_budget(controller)
+    assert controller.level == 1
+    assert settings.cached_layer
+
+
+def test_smooth_start_keeps_smooth_step():
+    settings = RenderSettings(smooth=True)
+    controller = QualityController(settings, verbose=False)
+
+    assert controller.steps[0][0] == "no smooth scaling"
+    over_budget(controller)
+    assert not settings.smooth
+
+    controller.apply(0)
+    assert settings.smooth
@@ -0,0 +1,22 @@
+from render import SpriteCache
+from session import Session
+
+
+def test_entities_use_the_session_sprites(level):
+    sprites = SpriteCache()
+    scene = level(6, sprites=sprites)
+
+    assert all(entity.sprites is sprites for entity in scene.entities)
+    # the 18 textures warmed, plus what the level composed
+    assert len(sprites.asset_bytes()) > 18
+
+
+def test_no_pool_builds_fresh_decoys(screen):
+    session = Session(6, pool=False)
+    session.warm()
+    assert session.waldo_pool == []
+
+    first = list(session.waldos(10, lambda: (0, 0)))
+    second = list(session.waldos(10, lambda: (0, 0)))
+    assert not set(map(id, first)) & set(map(id, second))
+    assert session.waldo_pool == []
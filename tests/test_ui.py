@@ -0,0 +1,91 @@
+import pygame
+from events import EventPipeline
+from ui_elements import Button, UIContainer
+
+
+class Menu:
+    """Stand-in scene: two buttons with a gap between them."""
+
+    def __init__(self):
+        self.clicked = []
+        self.ui = UIContainer()
+        self.a = self.ui.add(Button(100, 100, 200, 50, "A", on_click=lambda: self.clicked.append("a")))
+        self.b = self.ui.add(Button(100, 200, 200, 50, "B", on_click=lambda: self.clicked.append("b")))
+        self.handlers = self.ui.handlers()
+
+
+def mouse(kind, pos, button=1):
+    if kind == pygame.MOUSEMOTION:
+        return pygame.event.Event(kind, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+    return pygame.event.Event(kind, pos=pos, button=button)
+
+
+def run(scene, *events):
+    pipeline = EventPipeline()
+    pipeline.configure(scene)
+    pygame.event.clear()
+    for event in events:
+        pygame.event.post(event)
+    for event in pipeline.poll():
+        pipeline.dispatch(scene, event)
+
+
+def test_click_fires_once_on_release_over_same_button(screen):
+    menu = Menu()
+    run(menu, mouse(pygame.MOUSEBUTTONDOWN, (150, 120)), mouse(pygame.MOUSEBUTTONUP, (160, 125)))
+
+    assert menu.clicked == ["a"]
+    assert menu.ui.clicks == 1
+    assert menu.a.state == Button.HOVER
+
+
+def test_no_click_when_released_elsewhere(screen):
+    menu = Menu()
+    run(menu, mouse(pygame.MOUSEBUTTONDOWN, (150, 120)), mouse(pygame.MOUSEBUTTONUP, (150, 220)))
+    run(menu, mouse(pygame.MOUSEBUTTONDOWN, (150, 120)), mouse(pygame.MOUSEBUTTONUP, (10, 10)))
+    # right button never clicks
+    run(menu, mouse(pygame.MOUSEBUTTONDOWN, (150, 120), 3), mouse(pygame.MOUSEBUTTONUP, (150, 120), 3))
+
+    assert menu.clicked == []
+    assert menu.a.state == Button.NORMAL
+    assert menu.b.state == Button.NORMAL
+
+
+def test_hover_and_pressed_states(screen):
+    menu = Menu()
+    run(menu, mouse(pygame.MOUSEMOTION, (150, 120)))
+    assert menu.a.state == Button.HOVER
+
+    run(menu, mouse(pygame.MOUSEBUTTONDOWN, (150, 120)))
+    assert menu.a.state == Button.PRESSED
+
+    run(menu, mouse(pygame.MOUSEMOTION, (150, 220)))
+    assert menu.a.state == Button.PRESSED  # held until release
+    assert menu.b.state == Button.HOVER
+
+
+def test_widget_at_gaps(screen):
+    menu = Menu()
+    assert menu.ui.widget_at((150, 120)) is menu.a
+    assert menu.ui.widget_at((150, 220)) is menu.b
+    # same grid cell as a button, outside its rect
+    assert menu.ui.widget_at((150, 175)) is None
+    assert menu.ui.widget_at((310, 120)) is None
+    assert menu.ui.widget_at((900, 500)) is None
+
+
+def test_state_surfaces_rendered_once(screen, monkeypatch):
+    menu = Menu()
+    rendered = []
+    render_state = Button._render_state
+    monkeypatch.setattr(
+        Button, "_render_state",
+        lambda self, state: rendered.append(state) or render_state(self, state),
+    )
+
+    surface = pygame.Surface((960, 540))
+    for state in (Button.NORMAL, Button.HOVER, Button.PRESSED) * 3:
+        menu.a.set_state(state)
+        menu.a.draw(surface)
+
+    assert rendered == [Button.NORMAL, Button.HOVER, Button.PRESSED]
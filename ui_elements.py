@@ -1,4 +1,6 @@
+import time
 import pygame as pyg
+from assets import font_cache
 
 
 class UIElement:
@@ -24,7 +26,7 @@ class Label(UIElement):
     ):
         self.color = color
         self.bg_color = bg_color
-        self.font = pyg.font.Font(None, font_size)
+        self.font = font_cache.get(font_size)
         self.text = text
         self.text_surf = self.font.render(self.text, True, self.color)
 
@@ -50,7 +52,15 @@ class Label(UIElement):
         surface.blit(self.text_surf, text_rect)
 
 
+def _lighten(color, amount):
+    return tuple(min(255, c + amount) for c in color)
+
+
 class Button(UIElement):
+    NORMAL = "normal"
+    HOVER = "hover"
+    PRESSED = "pressed"
+
     def __init__(
         self,
         x,
@@ -62,21 +72,145 @@ class Button(UIElement):
         color=(255, 255, 255),
         bg_color=(0, 0, 0),
         on_click=None,
+        hover_bg_color=None,
+        pressed_bg_color=None,
     ):
         super().__init__(x, y, width, height, color)
         self.text = text
-        self.font = pyg.font.Font(None, font_size)
+        self.font = font_cache.get(font_size)
         self.color = color
         self.bg_color = bg_color
         self.on_click_callback = on_click
 
+        self.state_bg_colors = {
+            Button.NORMAL: bg_color,
+            Button.HOVER: hover_bg_color or _lighten(bg_color, 40),
+            Button.PRESSED: pressed_bg_color or _lighten(bg_color, 80),
+        }
+        self.state = Button.NORMAL
+        # rendered lazily, one Surface per state
+        self._state_surfs = {}
+
         self.text_surf = self.font.render(self.text, True, self.color)
         self.text_rect = self.text_surf.get_rect(center=self.rect.center)
 
+    def _render_state(self, state):
+        surf = pyg.Surface(self.rect.size)
+        local = surf.get_rect()
+        pyg.draw.rect(surf, self.state_bg_colors[state], local)
+        pyg.draw.rect(surf, self.color, local, 2)
+        surf.blit(self.text_surf, self.text_surf.get_rect(center=local.center))
+        return surf
+
+    def set_state(self, state):
+        self.state = state
+
+    def click(self):
+        if self.on_click_callback:
+            self.on_click_callback()
+
     def draw(self, surface):
-        pyg.draw.rect(surface, self.bg_color, self.rect)
-        pyg.draw.rect(surface, self.color, self.rect, 2)
-        surface.blit(self.text_surf, self.text_rect)
+        surf = self._state_surfs.get(self.state)
+        if surf is None:
+            surf = self._state_surfs[self.state] = self._render_state(self.state)
+        surface.blit(surf, self.rect)
+
+
+class UIContainer:
+    """Owns a scene's widgets and routes mouse input to them.
+
+    Widgets are bucketed into a coarse grid so a click is resolved by looking
+    up a single cell instead of testing every widget. Widgets with a `click`
+    method get hover/pressed states; the click fires on release over the
+    widget that was pressed.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.widgets = []
+        self._grid = {}
+
+        self.hovered = None
+        self.pressed = None
+
+        # input latency: time from the release event to the callback returning
+        self.clicks = 0
+        self.last_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+
+    def add(self, widget):
+        self.widgets.append(widget)
+
+        if hasattr(widget, "click"):
+            cs = self.cell_size
+            r = widget.rect
+            for cx in range(r.left // cs, (r.right - 1) // cs + 1):
+                for cy in range(r.top // cs, (r.bottom - 1) // cs + 1):
+                    self._grid.setdefault((cx, cy), []).append(widget)
+
+        return widget
+
+    def widget_at(self, pos):
+        cell = self._grid.get(
+            (pos[0] // self.cell_size, pos[1] // self.cell_size)
+        )
+        if cell:
+            for widget in cell:
+                if widget.rect.collidepoint(pos):
+                    return widget
+        return None
+
+    def handlers(self):
+        """Event handlers to merge into a scene's `handlers` table."""
+        return {
+            pyg.MOUSEMOTION: self.on_mouse_motion,
+            pyg.MOUSEBUTTONDOWN: self.on_mouse_down,
+            pyg.MOUSEBUTTONUP: self.on_mouse_up,
+        }
+
+    def _set_hovered(self, widget):
+        if widget is self.hovered:
+            return
+        if self.hovered is not None and self.hovered is not self.pressed:
+            self.hovered.set_state(Button.NORMAL)
+        self.hovered = widget
+        if widget is not None and widget is not self.pressed:
+            widget.set_state(Button.HOVER)
+
+    def on_mouse_motion(self, event):
+        self._set_hovered(self.widget_at(event.pos))
+
+    def on_mouse_down(self, event):
+        if event.button != pyg.BUTTON_LEFT:
+            return
+        widget = self.widget_at(event.pos)
+        if widget is not None:
+            self.pressed = widget
+            widget.set_state(Button.PRESSED)
+
+    def on_mouse_up(self, event):
+        if event.button != pyg.BUTTON_LEFT or self.pressed is None:
+            return
+        start = time.perf_counter()
+
+        pressed = self.pressed
+        self.pressed = None
+        pressed.set_state(Button.NORMAL)
+        if self.hovered is pressed:
+            self.hovered = None  # so it gets its hover state back below
+
+        widget = self.widget_at(event.pos)
+        self._set_hovered(widget)
+
+        if widget is pressed:
+            widget.click()
+            self.clicks += 1
+            self.last_latency_ms = (time.perf_counter() - start) * 1000
+            self.max_latency_ms = max(self.max_latency_ms, self.last_latency_ms)
+
+    def draw(self, surface):
+        for widget in self.widgets:
+            widget.draw(surface)
 
 
 class ProgressBar(UIElement):